@@ -0,0 +1,128 @@
+-- ========================================
+-- Migration: Precomputed share transaction aggregates
+-- Version: 002
+-- Purpose: Keep investments/proceeds/dividends/net per share in a summary table
+--          maintained by triggers, so the share list no longer aggregates all
+--          share transactions on every page render.
+-- ========================================
+
+--
+-- Table structure for table `tbl_shareAggregates`
+--
+
+CREATE TABLE IF NOT EXISTS `tbl_shareAggregates` (
+  `share_id` bigint(20) NOT NULL,
+  `investments` decimal(20,10) NOT NULL DEFAULT 0,
+  `proceeds` decimal(20,10) NOT NULL DEFAULT 0,
+  `dividends` decimal(20,10) NOT NULL DEFAULT 0,
+  `net` decimal(20,10) NOT NULL DEFAULT 0,
+  `updated_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`share_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3 COLLATE=utf8mb3_general_ci;
+
+--
+-- Procedure: Recompute the aggregate rows affected by a share and/or accounting entry
+-- p_share: share whose row must be refreshed (NULL to skip)
+-- p_entry: accounting entry whose linked shares must be refreshed (NULL to skip)
+--
+DROP PROCEDURE IF EXISTS `sp_refresh_share_aggregates`;
+DELIMITER $$
+CREATE PROCEDURE `sp_refresh_share_aggregates`(IN p_share BIGINT, IN p_entry BIGINT)
+BEGIN
+  INSERT INTO `tbl_shareAggregates` (`share_id`, `investments`, `proceeds`, `dividends`, `net`)
+  SELECT
+    st.`share`,
+    ABS(SUM(CASE WHEN st.`tradingVolume` > 0 THEN COALESCE(ae.`amount`, 0) ELSE 0 END)),
+    ABS(SUM(CASE WHEN st.`tradingVolume` < 0 THEN COALESCE(ae.`amount`, 0) ELSE 0 END)),
+    ABS(SUM(CASE WHEN st.`tradingVolume` = 0 THEN COALESCE(ae.`amount`, 0) ELSE 0 END)),
+    SUM(COALESCE(ae.`amount`, 0))
+  FROM `tbl_shareTransaction` st
+  LEFT JOIN `tbl_accountingEntry` ae ON st.`accountingEntry` = ae.`id`
+  WHERE st.`share` = p_share
+     OR st.`share` IN (SELECT `share` FROM `tbl_shareTransaction` WHERE `accountingEntry` = p_entry)
+  GROUP BY st.`share`
+  ON DUPLICATE KEY UPDATE
+    `investments` = VALUES(`investments`),
+    `proceeds` = VALUES(`proceeds`),
+    `dividends` = VALUES(`dividends`),
+    `net` = VALUES(`net`);
+
+  DELETE FROM `tbl_shareAggregates`
+  WHERE `share_id` = p_share
+    AND NOT EXISTS (SELECT 1 FROM `tbl_shareTransaction` WHERE `share` = p_share);
+END$$
+DELIMITER ;
+
+--
+-- Triggers: Keep tbl_shareAggregates in sync with share transactions
+--
+DROP TRIGGER IF EXISTS `trg_shareTransaction_aggregates_insert`;
+DELIMITER $$
+CREATE TRIGGER `trg_shareTransaction_aggregates_insert`
+AFTER INSERT ON `tbl_shareTransaction`
+FOR EACH ROW
+BEGIN
+  CALL `sp_refresh_share_aggregates`(NEW.`share`, NULL);
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_shareTransaction_aggregates_update`;
+DELIMITER $$
+CREATE TRIGGER `trg_shareTransaction_aggregates_update`
+AFTER UPDATE ON `tbl_shareTransaction`
+FOR EACH ROW
+BEGIN
+  CALL `sp_refresh_share_aggregates`(NEW.`share`, NULL);
+  IF NEW.`share` <> OLD.`share` THEN
+    CALL `sp_refresh_share_aggregates`(OLD.`share`, NULL);
+  END IF;
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_shareTransaction_aggregates_delete`;
+DELIMITER $$
+CREATE TRIGGER `trg_shareTransaction_aggregates_delete`
+AFTER DELETE ON `tbl_shareTransaction`
+FOR EACH ROW
+BEGIN
+  CALL `sp_refresh_share_aggregates`(OLD.`share`, NULL);
+END$$
+DELIMITER ;
+
+--
+-- Trigger: Refresh aggregates when the amount of a linked accounting entry changes
+--
+DROP TRIGGER IF EXISTS `trg_accountingEntry_share_aggregates_update`;
+DELIMITER $$
+CREATE TRIGGER `trg_accountingEntry_share_aggregates_update`
+AFTER UPDATE ON `tbl_accountingEntry`
+FOR EACH ROW
+BEGIN
+  IF NOT (NEW.`amount` <=> OLD.`amount`) THEN
+    CALL `sp_refresh_share_aggregates`(NULL, NEW.`id`);
+  END IF;
+END$$
+DELIMITER ;
+
+--
+-- Backfill: Aggregate all existing share transactions once
+--
+INSERT INTO `tbl_shareAggregates` (`share_id`, `investments`, `proceeds`, `dividends`, `net`)
+SELECT
+  st.`share`,
+  ABS(SUM(CASE WHEN st.`tradingVolume` > 0 THEN COALESCE(ae.`amount`, 0) ELSE 0 END)),
+  ABS(SUM(CASE WHEN st.`tradingVolume` < 0 THEN COALESCE(ae.`amount`, 0) ELSE 0 END)),
+  ABS(SUM(CASE WHEN st.`tradingVolume` = 0 THEN COALESCE(ae.`amount`, 0) ELSE 0 END)),
+  SUM(COALESCE(ae.`amount`, 0))
+FROM `tbl_shareTransaction` st
+LEFT JOIN `tbl_accountingEntry` ae ON st.`accountingEntry` = ae.`id`
+GROUP BY st.`share`
+ON DUPLICATE KEY UPDATE
+  `investments` = VALUES(`investments`),
+  `proceeds` = VALUES(`proceeds`),
+  `dividends` = VALUES(`dividends`),
+  `net` = VALUES(`net`);
+
+-- ========================================
+-- MIGRATION COMPLETE
+-- ========================================
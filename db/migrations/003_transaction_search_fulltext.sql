@@ -0,0 +1,12 @@
+-- ========================================
+-- Migration: Full-text index for transaction search
+-- Version: 003
+-- Purpose: Allow substring searches on description/recipientApplicant to use
+--          MATCH ... AGAINST instead of a LIKE '%term%' full table scan.
+-- ========================================
+
+CREATE FULLTEXT INDEX IF NOT EXISTS `idx_transaction_search_fulltext` ON `tbl_transaction` (`description`, `recipientApplicant`);
+
+-- ========================================
+-- MIGRATION COMPLETE
+-- ========================================
@@ -0,0 +1,12 @@
+-- ========================================
+-- Migration: Composite index for per-transaction accounting entries
+-- Version: 004
+-- Purpose: Serve "WHERE transaction = ? ORDER BY dateImport DESC" directly
+--          from the index without a filesort.
+-- ========================================
+
+CREATE INDEX IF NOT EXISTS `idx_accountingEntry_transaction_dateImport` ON `tbl_accountingEntry` (`transaction`, `dateImport`);
+
+-- ========================================
+-- MIGRATION COMPLETE
+-- ========================================
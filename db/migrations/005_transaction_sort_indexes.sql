@@ -0,0 +1,15 @@
+-- ========================================
+-- Migration: Sort-aligned indexes for the transaction list
+-- Version: 005
+-- Purpose: Let every indexed sort option of the transaction list walk an
+--          index in order (forwards or backwards) instead of a filesort
+--          over all transactions on deep pages.
+-- ========================================
+
+CREATE INDEX IF NOT EXISTS `idx_transaction_dateValue_dateImport` ON `tbl_transaction` (`dateValue`, `dateImport`);
+CREATE INDEX IF NOT EXISTS `idx_transaction_amount_dateValue` ON `tbl_transaction` (`amount`, `dateValue`, `dateImport`);
+CREATE INDEX IF NOT EXISTS `idx_transaction_description_dateValue` ON `tbl_transaction` (`description`, `dateValue`, `dateImport`);
+
+-- ========================================
+-- MIGRATION COMPLETE
+-- ========================================
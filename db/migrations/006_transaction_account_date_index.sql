@@ -0,0 +1,14 @@
+-- ========================================
+-- Migration: Account-scoped index for the transaction list
+-- Version: 006
+-- Purpose: Serve the account-filtered default list order (and the ID page of
+--          the deferred join) from the index alone: InnoDB secondary indexes
+--          carry the primary key, so (account, dateValue, dateImport) covers
+--          "SELECT t.id ... WHERE account = ? ORDER BY dateValue, dateImport".
+-- ========================================
+
+CREATE INDEX IF NOT EXISTS `idx_transaction_account_dateValue` ON `tbl_transaction` (`account`, `dateValue`, `dateImport`);
+
+-- ========================================
+-- MIGRATION COMPLETE
+-- ========================================
@@ -0,0 +1,123 @@
+-- ========================================
+-- Migration: Precomputed booked amounts per account and month
+-- Version: 007
+-- Purpose: Keep the sum of accounting entries per (account, YYYYMM) in a
+--          summary table maintained by triggers, so the year overview reads
+--          booked history from it instead of aggregating all transactions
+--          on every request.
+-- ========================================
+
+--
+-- Table structure for table `tbl_accountMonthFlow`
+--
+
+CREATE TABLE IF NOT EXISTS `tbl_accountMonthFlow` (
+  `account` bigint(20) NOT NULL,
+  `ym` int(11) NOT NULL,
+  `amount` decimal(20,10) NOT NULL DEFAULT 0,
+  `updated_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`account`, `ym`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3 COLLATE=utf8mb3_general_ci;
+
+--
+-- Procedure: Add an amount to the month of a transaction
+-- p_transaction: transaction whose account and dateValue select the row
+-- p_amount: signed amount to add
+--
+DROP PROCEDURE IF EXISTS `sp_add_account_month_flow`;
+DELIMITER $$
+CREATE PROCEDURE `sp_add_account_month_flow`(IN p_transaction BIGINT, IN p_amount DECIMAL(20,10))
+BEGIN
+  INSERT INTO `tbl_accountMonthFlow` (`account`, `ym`, `amount`)
+  SELECT t.`account`, EXTRACT(YEAR_MONTH FROM t.`dateValue`), p_amount
+  FROM `tbl_transaction` t
+  WHERE t.`id` = p_transaction
+  ON DUPLICATE KEY UPDATE `amount` = `amount` + VALUES(`amount`);
+END$$
+DELIMITER ;
+
+--
+-- Triggers: Keep tbl_accountMonthFlow in sync with accounting entries
+--
+DROP TRIGGER IF EXISTS `trg_accountingEntry_month_flow_insert`;
+DELIMITER $$
+CREATE TRIGGER `trg_accountingEntry_month_flow_insert`
+AFTER INSERT ON `tbl_accountingEntry`
+FOR EACH ROW
+BEGIN
+  IF NEW.`amount` IS NOT NULL THEN
+    CALL `sp_add_account_month_flow`(NEW.`transaction`, NEW.`amount`);
+  END IF;
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_accountingEntry_month_flow_update`;
+DELIMITER $$
+CREATE TRIGGER `trg_accountingEntry_month_flow_update`
+AFTER UPDATE ON `tbl_accountingEntry`
+FOR EACH ROW
+BEGIN
+  IF NOT (NEW.`amount` <=> OLD.`amount`) OR NEW.`transaction` <> OLD.`transaction` THEN
+    IF OLD.`amount` IS NOT NULL THEN
+      CALL `sp_add_account_month_flow`(OLD.`transaction`, -OLD.`amount`);
+    END IF;
+    IF NEW.`amount` IS NOT NULL THEN
+      CALL `sp_add_account_month_flow`(NEW.`transaction`, NEW.`amount`);
+    END IF;
+  END IF;
+END$$
+DELIMITER ;
+
+DROP TRIGGER IF EXISTS `trg_accountingEntry_month_flow_delete`;
+DELIMITER $$
+CREATE TRIGGER `trg_accountingEntry_month_flow_delete`
+AFTER DELETE ON `tbl_accountingEntry`
+FOR EACH ROW
+BEGIN
+  IF OLD.`amount` IS NOT NULL THEN
+    CALL `sp_add_account_month_flow`(OLD.`transaction`, -OLD.`amount`);
+  END IF;
+END$$
+DELIMITER ;
+
+--
+-- Trigger: Move the entries of a transaction when its account or month changes
+--
+DROP TRIGGER IF EXISTS `trg_transaction_month_flow_update`;
+DELIMITER $$
+CREATE TRIGGER `trg_transaction_month_flow_update`
+AFTER UPDATE ON `tbl_transaction`
+FOR EACH ROW
+BEGIN
+  IF NEW.`account` <> OLD.`account`
+     OR EXTRACT(YEAR_MONTH FROM NEW.`dateValue`) <> EXTRACT(YEAR_MONTH FROM OLD.`dateValue`) THEN
+    INSERT INTO `tbl_accountMonthFlow` (`account`, `ym`, `amount`)
+    SELECT OLD.`account`, EXTRACT(YEAR_MONTH FROM OLD.`dateValue`), -SUM(ae.`amount`)
+    FROM `tbl_accountingEntry` ae
+    WHERE ae.`transaction` = NEW.`id`
+    HAVING SUM(ae.`amount`) IS NOT NULL
+    ON DUPLICATE KEY UPDATE `amount` = `amount` + VALUES(`amount`);
+
+    INSERT INTO `tbl_accountMonthFlow` (`account`, `ym`, `amount`)
+    SELECT NEW.`account`, EXTRACT(YEAR_MONTH FROM NEW.`dateValue`), SUM(ae.`amount`)
+    FROM `tbl_accountingEntry` ae
+    WHERE ae.`transaction` = NEW.`id`
+    HAVING SUM(ae.`amount`) IS NOT NULL
+    ON DUPLICATE KEY UPDATE `amount` = `amount` + VALUES(`amount`);
+  END IF;
+END$$
+DELIMITER ;
+
+--
+-- Backfill: Aggregate all existing accounting entries once
+--
+INSERT INTO `tbl_accountMonthFlow` (`account`, `ym`, `amount`)
+SELECT t.`account`, EXTRACT(YEAR_MONTH FROM t.`dateValue`), SUM(ae.`amount`)
+FROM `tbl_transaction` t
+JOIN `tbl_accountingEntry` ae ON ae.`transaction` = t.`id`
+GROUP BY t.`account`, EXTRACT(YEAR_MONTH FROM t.`dateValue`)
+ON DUPLICATE KEY UPDATE `amount` = VALUES(`amount`);
+
+-- ========================================
+-- MIGRATION COMPLETE
+-- ========================================
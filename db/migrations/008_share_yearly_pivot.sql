@@ -0,0 +1,36 @@
+-- ========================================
+-- Migration: Yearly pivot of the share month-end snapshot
+-- Version: 008
+-- Purpose: Define the month-by-month pivot of portfolio values per share and
+--          year once in the schema, so the securities table of the year
+--          overview becomes a filtered read of one row per share.
+--          A filter on `year` is pushed down into the grouped view.
+-- ========================================
+
+--
+-- View: Portfolio value per share at each month-end of a year (one column per month)
+--
+CREATE OR REPLACE VIEW `view_shareYearlyPivot` AS
+SELECT
+  `share_id`,
+  `share_name`,
+  YEAR(`month_end_date`) AS `year`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 1 THEN `portfolio_value` END) AS `Januar`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 2 THEN `portfolio_value` END) AS `Februar`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 3 THEN `portfolio_value` END) AS `März`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 4 THEN `portfolio_value` END) AS `April`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 5 THEN `portfolio_value` END) AS `Mai`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 6 THEN `portfolio_value` END) AS `Juni`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 7 THEN `portfolio_value` END) AS `Juli`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 8 THEN `portfolio_value` END) AS `August`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 9 THEN `portfolio_value` END) AS `September`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 10 THEN `portfolio_value` END) AS `Oktober`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 11 THEN `portfolio_value` END) AS `November`,
+  MAX(CASE WHEN MONTH(`month_end_date`) = 12 THEN `portfolio_value` END) AS `Dezember`,
+  MAX(`volume`) AS `max_volume`
+FROM `view_shareMonthlySnapshot`
+GROUP BY `share_id`, `share_name`, YEAR(`month_end_date`);
+
+-- ========================================
+-- MIGRATION COMPLETE
+-- ========================================
@@ -0,0 +1,18 @@
+-- ========================================
+-- Migration: Covering indexes for the year overview flow aggregation
+-- Version: 009
+-- Purpose: The year overview sums accounting entry amounts per transaction
+--          and planning entries per planning after a date. With
+--          (transaction, amount) the entry sums are read from the index alone,
+--          and (planning, dateValue) turns the "future planning entries" join
+--          into a range on the index instead of a scan of all entries per
+--          planning. tbl_transaction (account, dateValue) is already covered
+--          by idx_transaction_account_dateValue (migration 006).
+-- ========================================
+
+CREATE INDEX IF NOT EXISTS `idx_accountingEntry_transaction_amount` ON `tbl_accountingEntry` (`transaction`, `amount`);
+CREATE INDEX IF NOT EXISTS `idx_planningEntry_planning_dateValue` ON `tbl_planningEntry` (`planning`, `dateValue`);
+
+-- ========================================
+-- MIGRATION COMPLETE
+-- ========================================
@@ -30,6 +30,30 @@ def get_database_config(subconfig: str = None) -> dict:
     return get_config_section(subconfig)
 
 
+def apply_session_settings(cursor, db_config: dict | None = None) -> None:
+    """
+    Apply the per-session timeouts to a freshly taken pooled connection.
+    
+    Failures are logged and ignored, the connection stays usable with the
+    server defaults.
+    
+    Args:
+        cursor: Cursor of the connection
+        db_config: Database config section; loaded when omitted
+    """
+    if db_config is None:
+        db_config = get_database_config('database')
+    try:
+        cursor.execute(f"SET SESSION net_read_timeout={db_config.get('net_read_timeout', 120)}")
+        cursor.execute(f"SET SESSION net_write_timeout={db_config.get('net_write_timeout', 120)}")
+        try:
+            cursor.execute(f"SET SESSION max_execution_time={db_config.get('max_execution_time', 120000)}")
+        except:
+            pass
+    except Exception as e:
+        logger.warning("Could not set session timeouts: %s", e)
+
+
 # ============================================================================
 # Session-based Auth Dependencies
 # ============================================================================
@@ -72,15 +96,7 @@ def get_db_cursor(
         cursor = conn.cursor(buffered=True)
         
         # Increase session timeouts
-        try:
-            cursor.execute(f"SET SESSION net_read_timeout={db_config.get('net_read_timeout', 120)}")
-            cursor.execute(f"SET SESSION net_write_timeout={db_config.get('net_write_timeout', 120)}")
-            try:
-                cursor.execute(f"SET SESSION max_execution_time={db_config.get('max_execution_time', 120000)}")
-            except:
-                pass
-        except Exception as e:
-            logger.warning("Could not set session timeouts: %s", e)
+        apply_session_settings(cursor, db_config)
         
         yield cursor
         
@@ -169,12 +185,7 @@ def get_db_connection(
         # Session timeouts
         try:
             cur = conn.cursor()
-            cur.execute(f"SET SESSION net_read_timeout={db_config.get('net_read_timeout', 120)}")
-            cur.execute(f"SET SESSION net_write_timeout={db_config.get('net_write_timeout', 120)}")
-            try:
-                cur.execute(f"SET SESSION max_execution_time={db_config.get('max_execution_time', 120000)}")
-            except:
-                pass
+            apply_session_settings(cur, db_config)
             cur.close()
         except Exception as e:
             logger.warning("Could not set session timeouts: %s", e)
@@ -15,6 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from api.dependencies import get_db_cursor, get_db_connection, get_pool_manager
 from api.error_handling import handle_db_errors, safe_commit, safe_rollback
 from api.auth_middleware import get_current_session
+from services.account_data_importer import invalidate_import_format_cache
 from services.import_service import ImportService
 from services.import_steps.planning_cycles import PlanningCyclesStep
 import json
@@ -160,6 +161,7 @@ async def add_import_format(
         try:
             setting_id = repo.add_setting(SETTINGS_KEY_IMPORT_FORMAT, value)
             safe_commit(connection)
+            invalidate_import_format_cache()
             return {"id": setting_id, "name": name, "config": config}
         except Exception as e:
             safe_rollback(connection)
@@ -216,6 +218,7 @@ async def update_import_format(
                     detail="Format not found"
                 )
             safe_commit(connection)
+            invalidate_import_format_cache()
             return {"id": setting_id, "name": name, "config": config}
         except HTTPException:
             safe_rollback(connection)
@@ -243,6 +246,7 @@ async def delete_import_format(
         try:
             deleted = repo.delete_setting_by_id(setting_id)
             safe_commit(connection)
+            invalidate_import_format_cache()
             if deleted == 0:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Format not found")
             return {"status": "success"}
@@ -328,6 +332,7 @@ async def upload_import_formats_yaml(
                     errors.append(f"Format '{format_name}': {str(e)}")
             
             safe_commit(connection)
+            invalidate_import_format_cache()
             
             return {
                 "status": "success",
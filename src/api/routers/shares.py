@@ -496,20 +496,18 @@ async def import_share_history(
         errors = []
         
         try:
-            csv_reader = csv.DictReader(
-                io.StringIO(text_content),
-                fieldnames=['identifier', 'date_str', 'amount_str'],
-                delimiter=';'
-            )
+            # Positional columns (identifier, date, amount); blank lines
+            # are skipped and short rows padded, as csv.DictReader did
+            csv_rows = (row for row in csv.reader(io.StringIO(text_content), delimiter=';') if row)
             # Skip header
-            next(csv_reader, None)
+            next(csv_rows, None)
             
-            for row_num, row in enumerate(csv_reader, start=2):
+            for row_num, row in enumerate(csv_rows, start=2):
                 try:
                     # Validate required fields
-                    identifier = row.get('identifier', '').strip() if row.get('identifier') else None
-                    date_str = row.get('date_str', '').strip() if row.get('date_str') else None
-                    amount_str = row.get('amount_str', '').strip() if row.get('amount_str') else None
+                    identifier, date_str, amount_str = (
+                        cell.strip() or None for cell in (row + ['', '', ''])[:3]
+                    )
                     
                     if not all([identifier, date_str, amount_str]):
                         errors.append(f"Row {row_num}: Missing required fields")
@@ -716,20 +714,18 @@ async def import_share_transactions(
         errors = []
         
         try:
-            csv_reader = csv.DictReader(
-                io.StringIO(text_content),
-                fieldnames=['identifier', 'date_str', 'shares_str'],
-                delimiter=';'
-            )
+            # Positional columns (identifier, date, shares); blank lines
+            # are skipped and short rows padded, as csv.DictReader did
+            csv_rows = (row for row in csv.reader(io.StringIO(text_content), delimiter=';') if row)
             # Skip header
-            next(csv_reader, None)
+            next(csv_rows, None)
             
-            for row_num, row in enumerate(csv_reader, start=2):
+            for row_num, row in enumerate(csv_rows, start=2):
                 try:
                     # Validate required fields
-                    identifier = row.get('identifier', '').strip() if row.get('identifier') else None
-                    date_str = row.get('date_str', '').strip() if row.get('date_str') else None
-                    shares_str = row.get('shares_str', '').strip() if row.get('shares_str') else None
+                    identifier, date_str, shares_str = (
+                        cell.strip() or None for cell in (row + ['', '', ''])[:3]
+                    )
                     
                     # Treat empty shares as 0 (dividend/no trading volume)
                     if not shares_str or shares_str == '':
@@ -27,6 +27,7 @@ from api.error_handling import handle_db_errors, safe_commit, safe_rollback
 from api.models import ImportRequest, AutoCategorizeRequest
 from services.account_data_importer import AccountDataImporter
 from services.category_automation import load_rules, apply_rules_to_transaction
+from services.csv_utils import list_import_files
 import tempfile
 import os
 from pathlib import Path
@@ -55,6 +56,8 @@ def auto_categorize_entries(cursor, connection) -> dict:
             return {"categorized": 0, "total_checked": 0, "message": "No uncategorized entries found."}
         
         categorized_entry_count = 0
+        # Rules applicable per account, filtered once instead of per entry
+        rules_by_account = {}
         
         for entry in entries:
             entry_id = entry["entry_id"]
@@ -67,10 +70,13 @@ def auto_categorize_entries(cursor, connection) -> dict:
             account_id = entry["account_id"]
             
             # Filter rules for this specific account
-            account_rules = [
-                rule for rule in rules
-                if not rule.get('accounts') or account_id in rule.get('accounts', [])
-            ]
+            account_rules = rules_by_account.get(account_id)
+            if account_rules is None:
+                account_rules = [
+                    rule for rule in rules
+                    if not rule.get('accounts') or account_id in rule.get('accounts', [])
+                ]
+                rules_by_account[account_id] = account_rules
             
             # Apply rules
             category_id = apply_rules_to_transaction(transaction_data, account_rules)
@@ -132,6 +138,8 @@ async def get_transactions(
     date_to: Optional[str] = Query(None, description="Filter by transaction date (YYYY-MM-DD) to"),
     sort_by: Optional[str] = Query(None, description="Sort by: 'date', 'description', 'amount', 'account', 'entries'"),
     sort_dir: Optional[str] = Query(None, description="Sort direction: 'asc' or 'desc'"),
+    fulltext: bool = Query(False, description="Use the full-text index for substring searches"),
+    search_mode: str = Query("contains", pattern="^(prefix|contains)$", description="Match plain search terms as 'contains' (default) or 'prefix'"),
     cursor = Depends(get_db_cursor)
 ):
     """
@@ -139,7 +147,8 @@ async def get_transactions(
     
     - **page**: Page number (starting from 1)
     - **page_size**: Number of items per page (max 1000)
-    - **search**: Optional search term for filtering
+    - **search**: Optional search term for filtering ('"term"' exact, 'term*' prefix, '*term' suffix, '*term*' substring)
+    - **search_mode**: How plain search terms match: 'contains' (default, substring) or 'prefix' (index-usable)
     - **filter**: Optional filter:
         - 'unchecked': transactions with at least one unchecked entry
         - 'no_entries': transactions without any entries
@@ -164,7 +173,9 @@ async def get_transactions(
         date_from=date_from,
         date_to=date_to,
         sort_by=sort_by,
-        sort_dir=sort_dir
+        sort_dir=sort_dir,
+        fulltext=fulltext,
+        search_mode=search_mode
     )
     
     return TransactionListResponse(
@@ -344,7 +355,7 @@ async def import_transactions(
                     skipped_info.append(f"Path not found: {job.path}")
                     continue
                     
-                files = sorted(job.path.glob(f"*.{job.file_ending}"))
+                files = list_import_files(job.path, job.file_ending)
                 if not files:
                     skipped_info.append(f"No *.{job.file_ending} files in {job.path}")
                     continue
@@ -10,13 +10,19 @@
 
 from fastapi import APIRouter, Depends, Query
 
-from api.dependencies import get_db_cursor
+from api.auth_context import AuthContext, get_auth_context
+from api.auth_middleware import get_current_session
+from api.dependencies import apply_session_settings, get_db_cursor
 from api.error_handling import handle_db_errors
 from repositories.year_overview_repository import YearOverviewRepository
 
 router = APIRouter(prefix="/year-overview", tags=["year-overview"])
 years_router = APIRouter(prefix="/years", tags=["years"])
 
+# Extra pooled connections used by /all; one further connection of the
+# session pool always stays free for parallel requests
+_MAX_OVERVIEW_WORKERS = 2
+
 
 @router.get("/account-balances")
 @handle_db_errors("fetch account balances")
@@ -119,6 +125,44 @@ async def get_assets_month_end(
     return {"year": year, "rows": data}
 
 
+@router.get("/all")
+@handle_db_errors("fetch year overview")
+async def get_year_overview(
+  year: int = Query(..., ge=1900, le=3000, description="Year for which the overview is requested"),
+  cursor = Depends(get_db_cursor),
+  session_id: str = Depends(get_current_session),
+  auth_context: AuthContext = Depends(get_auth_context),
+):
+    """Return all year overview tables in one response (one HTTP round-trip instead of six).
+    Keys: assets_month_end, account_balances, account_balances_monthly, investments, loans, securities.
+    The tables are queried in parallel only when the session pool has spare
+    connections (pool_size > 2, up to two extra); with the default pool size
+    of 2 they are queried one after another on the request cursor.
+    """
+    pool_manager = auth_context.pool_manager
+
+    def connect():
+        connection = pool_manager.get_connection(session_id)
+        # Each table is its own read-only statement, as on the request cursor
+        connection.autocommit = True
+        settings_cursor = connection.cursor()
+        try:
+            apply_session_settings(settings_cursor)
+        finally:
+            settings_cursor.close()
+        return connection
+
+    repository = YearOverviewRepository(cursor)
+    data = repository.get_all_concurrent(
+        year,
+        connect,
+        # The request cursor holds one connection and one more stays free
+        max_workers=min(_MAX_OVERVIEW_WORKERS, pool_manager.pool_size - 2),
+    )
+
+    return {"year": year, "tables": data}
+
+
 @years_router.get("/")
 @handle_db_errors("fetch available years")
 async def get_available_years(cursor=Depends(get_db_cursor)):
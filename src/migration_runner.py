@@ -23,6 +23,21 @@ from pymysql.cursors import DictCursor
 
 logger = logging.getLogger("uvicorn.error")
 
+# Indexes the list and year overview queries rely on; a missing one is
+# reported after the migration check instead of silently degrading to scans
+EXPECTED_INDEXES = {
+    'tbl_transaction': (
+        'idx_transaction_dateValue_dateImport',
+        'idx_transaction_account_dateValue',
+    ),
+    'tbl_accountingEntry': (
+        'idx_accountingEntry_transaction_amount',
+    ),
+    'tbl_planningEntry': (
+        'idx_planningEntry_planning_dateValue',
+    ),
+}
+
 
 class MigrationRunner:
     """
@@ -103,6 +118,24 @@ class MigrationRunner:
         """, (self.db_config['database'],))
         return cursor.fetchone()['count'] > 0
     
+    def _check_expected_indexes(self, connection: pymysql.Connection) -> List[str]:
+        """
+        Log a warning for every index of EXPECTED_INDEXES missing in the database.
+        
+        Returns:
+            List of missing indexes as 'table.index'
+        """
+        missing = []
+        with connection.cursor() as cursor:
+            for table, index_names in EXPECTED_INDEXES.items():
+                cursor.execute(f"SHOW INDEX FROM `{table}`")
+                existing = {row['Key_name'] for row in cursor.fetchall()}
+                missing.extend(f"{table}.{name}" for name in index_names if name not in existing)
+
+        for name in missing:
+            logger.warning(f"Expected index {name} is missing; transaction list queries will fall back to table scans")
+        return missing
+
     def _get_migration_files(self) -> List[Tuple[str, Path]]:
         """
         Get sorted list of migration files.
@@ -381,6 +414,8 @@ class MigrationRunner:
                     self.progress_callback('preparing', f'Insgesamt {total_statements} Migrationsschritte zu ausführen...', 0, total_statements)
                 else:
                     self.progress_callback('complete', 'Alle Migrationen sind aktuell!', 0, 0)
+                    if not dry_run:
+                        self._check_expected_indexes(connection)
                     return results
             
             # Global counter for tracking statement progress
@@ -427,6 +462,9 @@ class MigrationRunner:
                 if self.progress_callback:
                     self.progress_callback('complete', 'Alle Migrationen sind aktuell!', statement_counter['current'], statement_counter['total'])
             
+            if not dry_run:
+                self._check_expected_indexes(connection)
+            
             return results
             
         except Exception as e:
@@ -0,0 +1,48 @@
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2026 m2-eng
+# Author: m2-eng
+# License: GNU Affero General Public License v3.0 (AGPL-3.0-only)
+# Purpose: Maintenance of precomputed summary tables.
+#
+"""
+Maintenance of precomputed summary tables.
+
+tbl_accountMonthFlow (migration 007) is kept current by triggers; the
+functions here rebuild it from the base tables, e.g. after bulk changes made
+with triggers disabled or to repair drift.
+"""
+
+from __future__ import annotations
+
+
+def refresh_year_overview(cursor, year: int) -> int:
+    """
+    Recompute the booked amounts per account and month of one year.
+    
+    Args:
+        cursor: Database cursor (the caller commits)
+        year: Year whose months are rebuilt
+    
+    Returns:
+        Number of (account, month) rows written
+    """
+    ym_first = year * 100 + 1
+    ym_last = year * 100 + 12
+
+    cursor.execute(
+        "DELETE FROM tbl_accountMonthFlow WHERE ym BETWEEN %s AND %s",
+        (ym_first, ym_last),
+    )
+    cursor.execute(
+        """
+        INSERT INTO tbl_accountMonthFlow (account, ym, amount)
+        SELECT t.account, EXTRACT(YEAR_MONTH FROM t.dateValue) AS ym, SUM(ae.amount)
+        FROM tbl_transaction t
+        JOIN tbl_accountingEntry ae ON ae.transaction = t.id
+        WHERE t.dateValue >= %s AND t.dateValue < %s
+        GROUP BY t.account, ym
+        """,
+        (f"{year}-01-01", f"{year + 1}-01-01"),
+    )
+    return max(cursor.rowcount or 0, 0)
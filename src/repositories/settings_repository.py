@@ -35,6 +35,21 @@ class SettingsRepository:
         rows = self.cursor.fetchall()
         return [row[0] for row in rows] if rows else []
 
+    def get_settings_version(self, key: str) -> tuple:
+        """Cheap change marker for the global entries of a key.
+
+        (count, newest updated_at, highest id) changes on every insert, delete
+        and update, except for two updates within the same second.
+        """
+        query = """
+            SELECT COUNT(*), MAX(updated_at), MAX(id)
+            FROM tbl_setting
+            WHERE user_id IS NULL AND `key` = %s
+        """
+        self.cursor.execute(query, (key,))
+        row = self.cursor.fetchone()
+        return tuple(row) if row else ()
+
     def add_setting(self, key: str, value_json, user_id: int | None = None):
         """Add a new setting entry (allows multiple entries per key)"""
         query = """
@@ -163,13 +163,13 @@ class ShareHistoryRepository:
 
     def get_existing_dates_for_share(self, share_id):
         """Return a set of dates (YYYY-MM-DD) that already exist for a share history"""
-        query = "SELECT DATE(date) as date_only FROM tbl_shareHistory WHERE share = %s"
+        # Deduplicate in MySQL; DATE() returns date objects, formatted here
+        query = "SELECT DISTINCT DATE(date) FROM tbl_shareHistory WHERE share = %s"
         self.cursor.execute(query, (share_id,))
-        rows = self.cursor.fetchall()
-        return set([
+        return {
             row[0].isoformat() if hasattr(row[0], 'isoformat') else str(row[0]).split('T')[0]
-            for row in rows
-        ]) if rows else set()
+            for row in self.cursor.fetchall()
+        }
 
     def delete_history(self, history_id):
         """Delete a history record by ID"""
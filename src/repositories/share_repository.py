@@ -60,6 +60,7 @@ class ShareRepository:
         sort_column = sort_column_map.get(sort_by, 's.name')
         sort_direction = 'DESC' if (sort_dir or '').lower() == 'desc' else 'ASC'
 
+        # Aggregated sums are precomputed in tbl_shareAggregates (maintained by triggers)
         count_query = f"""
             SELECT COUNT(*)
             FROM view_sharePortfolioValue s
@@ -74,17 +75,7 @@ class ShareRepository:
                 COALESCE(agg.net, 0) AS net,
                 COALESCE(agg.dividends, 0) AS dividends
             FROM view_sharePortfolioValue s
-            LEFT JOIN (
-                SELECT 
-                    st.share AS share_id,
-                    ABS(SUM(CASE WHEN st.tradingVolume > 0 THEN COALESCE(ae.amount, 0) ELSE 0 END)) AS investments,
-                    ABS(SUM(CASE WHEN st.tradingVolume < 0 THEN COALESCE(ae.amount, 0) ELSE 0 END)) AS proceeds,
-                    ABS(SUM(CASE WHEN st.tradingVolume = 0 THEN COALESCE(ae.amount, 0) ELSE 0 END)) AS dividends,
-                    SUM(COALESCE(ae.amount, 0)) AS net
-                FROM tbl_shareTransaction st
-                LEFT JOIN tbl_accountingEntry ae ON st.accountingEntry = ae.id
-                GROUP BY st.share
-            ) agg ON agg.share_id = s.id
+            LEFT JOIN tbl_shareAggregates agg ON agg.share_id = s.id
             {where_clause}
             ORDER BY {sort_column} {sort_direction}
             LIMIT %s OFFSET %s
@@ -6,65 +6,301 @@
 # License: GNU Affero General Public License v3.0 (AGPL-3.0-only)
 # Purpose: Module for transaction repository.
 #
+import hashlib
+from collections import defaultdict, namedtuple
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Iterator
 
 from repositories.base import BaseRepository
 
 
-class TransactionRepository(BaseRepository):
-   def __init__(self, cursor):
-      """Initialize repository with cursor and category cache."""
-      super().__init__(cursor)
-      self._category_cache = None
+_AMOUNT_QUANTUM = Decimal("1E-10")
+
+
+def _duplicate_hash(row: tuple) -> str:
+   """
+   Compute tbl_transaction.duplicateHashComputed for an insert row in Python.
    
-   def _build_category_name_map(self) -> dict:
-      """
-      Build a map of category IDs to their full hierarchical names.
-      Uses a single query and builds the hierarchy in Python.
-      
-      Returns:
-         Dictionary mapping category ID to full category name
-      """
-      if self._category_cache is not None:
-         return self._category_cache
-      
-      # Load all categories
-      sql = "SELECT id, name, category FROM tbl_category ORDER BY id"
-      self.cursor.execute(sql)
-      categories = {row[0]: {"name": row[1], "parent_id": row[2]} for row in self.cursor.fetchall()}
-      
-      # Build full names
-      category_names = {}
-      
-      def build_full_name(cat_id):
-         if cat_id not in categories:
-            return None
-         if cat_id in category_names:
-            return category_names[cat_id]
-         
-         cat = categories[cat_id]
-         name = cat["name"]
-         parent_id = cat["parent_id"]
-         
-         if parent_id and parent_id in categories:
-            parent_name = build_full_name(parent_id)
-            if parent_name:
-               full_name = f"{parent_name} > {name}"
-            else:
-               full_name = name
-         else:
-            full_name = name
-         
-         category_names[cat_id] = full_name
-         return full_name
+   Mirrors the generated column MD5(CONCAT(COALESCE(iban,''),'|',description,'|',
+   amount,'|',dateValue,'|',account)) with amount rendered as DECIMAL(20,10)
+   and dateValue as DATETIME text. A row whose rendering differs from the
+   server's only loses the pre-filter, the unique key still applies.
+   
+   Args:
+      row: Tuple (iban, bic, description, amount, date_value, recipient_applicant, account_id)
+   
+   Returns:
+      Lowercase hex MD5 digest
+   """
+   iban, _bic, description, amount, date_value, _recipient, account_id = row
+   amount_text = format(Decimal(amount).quantize(_AMOUNT_QUANTUM, rounding=ROUND_HALF_UP), "f")
+   date_text = date_value.strftime("%Y-%m-%d %H:%M:%S") if isinstance(date_value, datetime) else str(date_value)
+   key = f"{iban or ''}|{description}|{amount_text}|{date_text}|{account_id}"
+   return hashlib.md5(key.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=4)
+def _insert_ignore_sql(row_count: int) -> str:
+   """Multi-row INSERT IGNORE statement for row_count transactions; full chunks reuse one string."""
+   values_sql = ", ".join(["(NOW(), %s, %s, %s, %s, %s, %s, %s)"] * row_count)
+   return (
+      f"""INSERT IGNORE INTO tbl_transaction
+         (dateImport, iban, bic, description, amount, dateValue, recipientApplicant, account)
+         VALUES {values_sql}"""
+   )
+
+
+@lru_cache(maxsize=256)
+def classify_like(search: str) -> tuple[str, str]:
+   """
+   Classify a user search term by its pattern shape.
+   
+   Supported syntax: '"term"' (exact), 'term*' (prefix), '*term' (suffix),
+   'term' or '*term*' (contains). SQL wildcards, the LIKE escape character
+   or inner '*' are 'complex'. Results are cached; repeated terms (paging
+   through one search) are classified once.
+   
+   Args:
+      search: Raw search term
       
-      # Build names for all categories
-      for cat_id in categories:
-         build_full_name(cat_id)
+   Returns:
+      Tuple (kind, needle) with kind in 'eq', 'prefix', 'suffix', 'contains', 'complex'
+   """
+   term = search.strip()
+   if len(term) >= 2 and term.startswith('"') and term.endswith('"'):
+      return "eq", term[1:-1]
+
+   leading = term.startswith("*")
+   trailing = term.endswith("*")
+   needle = term.strip("*")
+   if "*" in needle or "%" in needle or "_" in needle or "\\" in needle:
+      return "complex", needle.replace("*", "%")
+   if trailing and not leading:
+      return "prefix", needle
+   if leading and not trailing:
+      return "suffix", needle
+   return "contains", needle
+
+
+# Lightweight row objects for the read paths (built in C via _make, serialisable via _asdict)
+Transaction = namedtuple(
+   "Transaction",
+   "id dateImport dateValue description amount iban bic recipientApplicant "
+   "account_id account_name account_iban entries"
+)
+AccountingEntry = namedtuple(
+   "AccountingEntry",
+   "id dateImport checked amount accountingPlanned category category_name"
+)
+
+# Entries of one transaction, served from the (transaction, dateImport) index (migration 004)
+_ACCOUNTING_ENTRIES_SQL = """
+   SELECT 
+      ae.id,
+      ae.dateImport,
+      ae.checked,
+      ae.amount,
+      ae.accountingPlanned,
+      ae.category,
+      vcf.fullname as category_name
+   FROM tbl_accountingEntry ae
+   LEFT JOIN view_categoryFullname vcf ON ae.category = vcf.id
+   WHERE ae.transaction = %s
+   ORDER BY ae.dateImport DESC
+"""
+
+# Whitelisted sort columns for get_all_transactions_paginated. date sorts and
+# descending amount/description sorts are backed by sort-aligned indexes
+# (migration 005); account and entries sort on joined/derived values and
+# cannot be served from an index
+_SORT_COLUMNS = MappingProxyType({
+   "date": "t.dateValue",
+   "description": "t.description",
+   "amount": "t.amount",
+   "account": "a.name",
+   # Correlated count only probes the ae.transaction index for the rows being ordered
+   "entries": "(SELECT COUNT(*) FROM tbl_accountingEntry ae_count WHERE ae_count.transaction = t.id)"
+})
+
+# HAVING conditions of the tx_filt CTE per filter type: one grouped LEFT JOIN
+# over the entries instead of a correlated EXISTS probe per transaction row
+_FILTER_HAVING = MappingProxyType({
+   "unchecked": "SUM(ae.checked = 0) > 0",
+   "no_entries": "COUNT(ae.id) = 0",
+   "uncategorized": "SUM(ae.id IS NOT NULL AND ae.category IS NULL) > 0",
+   "categorized_unchecked": "SUM(ae.category IS NOT NULL AND ae.checked = 0) > 0"
+})
+
+
+def _search_mode_and_params(
+   search: str,
+   fulltext: bool = False,
+   default_mode: str = "contains"
+) -> tuple[str, list]:
+   """
+   Determine the search mode of a term based on its pattern shape and its parameters.
+   
+   Exact and prefix searches produce index-usable predicates; 'contains'
+   searches use the FULLTEXT index on description/recipientApplicant
+   (migration 003) when requested and fall back to the LIKE '%term%' scan
+   otherwise. Plain terms without pattern syntax use default_mode; with
+   default_mode 'prefix' only '*term*' produces a leading wildcard.
+   
+   Args:
+      search: Raw search term
+      fulltext: Use MATCH ... AGAINST for 'contains' searches
+      default_mode: Mode for plain terms ('contains' or 'prefix')
       
-      self._category_cache = category_names
-      return category_names
+   Returns:
+      Tuple (search_mode, params) with search_mode in 'fulltext', 'eq', 'prefix', 'suffix', 'contains', 'complex'
+   """
+   kind, needle = classify_like(search)
+   if kind == "contains" and default_mode == "prefix" and not search.strip().startswith("*"):
+      kind = "prefix"
+
+   if kind == "contains" and fulltext and needle:
+      words = [word for word in needle.split() if word]
+      return "fulltext", [" ".join(f"+{word}*" for word in words)]
+
+   if kind == "eq":
+      value = needle
+   elif kind == "prefix":
+      value = f"{needle}%"
+   elif kind == "suffix":
+      value = f"%{needle}"
+   else:
+      value = f"%{needle}%"
+   return kind, [value] * 6
+
+
+def _search_clause_sql(search_mode: str) -> str:
+   """Return the search predicate for a search mode (see _search_mode_and_params)."""
+   if search_mode == "fulltext":
+      return "MATCH(t.description, t.recipientApplicant) AGAINST (%s IN BOOLEAN MODE)"
+
+   operator = "=" if search_mode == "eq" else "LIKE"
+   return f"""(
+         t.description {operator} %s OR 
+         t.recipientApplicant {operator} %s OR 
+         t.iban {operator} %s OR 
+         t.bic {operator} %s OR 
+         a.name {operator} %s OR
+         EXISTS (
+            SELECT 1 FROM tbl_accountingEntry ae 
+            LEFT JOIN tbl_category c ON ae.category = c.id 
+            WHERE ae.transaction = t.id AND c.name {operator} %s
+         )
+      )"""
+
+
+@lru_cache(maxsize=64)
+def _build_transaction_page_sql(
+   search_mode: str | None,
+   filter_type: str | None,
+   has_account: bool,
+   has_date_from: bool,
+   has_date_to: bool,
+   sort_by: str | None,
+   sort_direction: str
+) -> tuple[str, str]:
+   """
+   Build the count and page SQL for one query shape of get_all_transactions_paginated.
+   
+   Only shape flags are part of the cache key, never values, so identical
+   shapes share one statement text; the values are bound as parameters in
+   the order search, account, date_from, date_to (+ LIMIT/OFFSET for the page).
+   
+   Returns:
+      Tuple (count_sql, data_sql); data_sql rows end with the filtered total,
+      count_sql is only needed when the requested page is empty
+   """
+   where_clauses = []
+   if search_mode:
+      where_clauses.append(_search_clause_sql(search_mode))
+   if has_account:
+      where_clauses.append("t.account = %s")
+   if has_date_from:
+      where_clauses.append("t.dateValue >= %s")
+   if has_date_to:
+      where_clauses.append("t.dateValue <= %s")
+   where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+
+   filter_having = _FILTER_HAVING.get(filter_type)
+   if filter_having:
+      # The search/account/date predicates run inside the CTE, so only the
+      # matching transactions are grouped; the outer query needs no WHERE
+      # and the parameter order stays the same
+      with_sql = f"""WITH tx_filt AS (
+         SELECT t.id
+         FROM tbl_transaction t
+         JOIN tbl_account a ON t.account = a.id
+         LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t.id
+         WHERE {where_sql}
+         GROUP BY t.id
+         HAVING {filter_having}
+      )"""
+      from_sql = "tx_filt f JOIN tbl_transaction t ON t.id = f.id JOIN tbl_account a ON t.account = a.id"
+      where_sql = "1=1"
+   else:
+      with_sql = ""
+      from_sql = "tbl_transaction t JOIN tbl_account a ON t.account = a.id"
+
+   # Ties are always broken newest first (dateValue, dateImport DESC), as
+   # the transaction list has always shown them; unknown sort keys fall back
+   # to the default order
+   sort_column = _SORT_COLUMNS.get(sort_by)
+   if sort_column == "t.dateValue":
+      order_by = f"t.dateValue {sort_direction}, t.dateImport {sort_direction}"
+   elif sort_column:
+      order_by = f"{sort_column} {sort_direction}, t.dateValue DESC, t.dateImport DESC"
+   else:
+      order_by = "t.dateValue DESC, t.dateImport DESC"
+
+   count_sql = f"{with_sql} SELECT COUNT(*) FROM {from_sql} WHERE {where_sql}"
+
+   # Deferred join: page over narrow transaction IDs first, then fetch the
+   # wide columns only for the rows of the requested page. The window count
+   # is evaluated before LIMIT, so every page row carries the filtered total
+   page_sql = f"""
+      SELECT t.id, COUNT(*) OVER() AS total
+      FROM {from_sql}
+      WHERE {where_sql}
+      ORDER BY {order_by}
+      LIMIT %s OFFSET %s
+   """
+   data_sql = f"""
+      {with_sql}
+      SELECT 
+         t.id,
+         t.dateImport,
+         t.dateValue,
+         t.description,
+         t.amount,
+         t.iban,
+         t.bic,
+         t.recipientApplicant,
+         a.id as account_id,
+         a.name as account_name,
+         a.iban_accountNumber,
+         EXISTS(SELECT 1 FROM tbl_accountingEntry ae_any WHERE ae_any.transaction = t.id) as has_entries,
+         p.total
+      FROM ({page_sql}) p
+      JOIN tbl_transaction t ON t.id = p.id
+      JOIN tbl_account a ON t.account = a.id
+      ORDER BY {order_by}
+   """
+   return count_sql, data_sql
+
+
+class TransactionRepository(BaseRepository):
+   def __init__(self, cursor):
+      """Initialize repository with cursor."""
+      super().__init__(cursor)
    
    def insert_ignore(
       self,
@@ -110,28 +346,158 @@ class TransactionRepository(BaseRepository):
       Args:
          rows: List of tuples (iban, bic, description, amount, date_value, recipient_applicant, account_id)
 
+      Returns:
+         Number of rows inserted (duplicates ignored).
+      """
+      return self.insert_ignore_many_chunked(rows)
+
+   def insert_ignore_many_dedup(self, rows: list[tuple], account_id: int, chunk_size: int = 1000) -> int:
+      """
+      Batch insert transactions of one account, skipping known duplicates up front.
+      
+      The duplicate hashes already stored for the account within the date
+      window of the rows are loaded once and matching rows are dropped before
+      sending; INSERT IGNORE still guards against concurrent imports.
+      
+      Args:
+         rows: List of tuples (iban, bic, description, amount, date_value, recipient_applicant, account_id)
+         account_id: Account all rows belong to
+         chunk_size: Maximum number of rows per INSERT statement
+      
       Returns:
          Number of rows inserted (duplicates ignored).
       """
       if not rows:
          return 0
 
-      sql = (
-         """INSERT IGNORE INTO tbl_transaction
-               (dateImport, iban, bic, description, amount, dateValue, recipientApplicant, account)
-               VALUES (NOW(), %s, %s, %s, %s, %s, %s, %s)"""
+      dates = [row[4] for row in rows]
+      self.cursor.execute(
+         """SELECT duplicateHashComputed FROM tbl_transaction
+            WHERE account = %s AND dateValue BETWEEN %s AND %s""",
+         (account_id, min(dates), max(dates)),
       )
-      self.cursor.executemany(sql, rows)
-      return max(self.cursor.rowcount or 0, 0)
+      existing = {row[0] for row in self.cursor.fetchall()}
+      if not existing:
+         return self.insert_ignore_many_chunked(rows, chunk_size)
+
+      return self.insert_ignore_many_chunked(
+         [row for row in rows if _duplicate_hash(row) not in existing], chunk_size
+      )
+
+   def insert_ignore_many_chunked(self, rows: list[tuple], chunk_size: int = 1000) -> int:
+      """
+      Batch insert transactions with one multi-row INSERT IGNORE per chunk.
+
+      Each chunk is sent as a single 'INSERT IGNORE ... VALUES (...), (...)'
+      statement, i.e. one round-trip per chunk_size rows.
+
+      Args:
+         rows: List of tuples (iban, bic, description, amount, date_value, recipient_applicant, account_id)
+         chunk_size: Maximum number of rows per statement
 
-   def get_all_transactions(self) -> list[dict]:
+      Returns:
+         Number of rows inserted (duplicates ignored), summed across chunks.
+      """
+      if not rows:
+         return 0
+
+      inserted = 0
+      for start in range(0, len(rows), chunk_size):
+         chunk = rows[start:start + chunk_size]
+         self.cursor.execute(_insert_ignore_sql(len(chunk)), [value for row in chunk for value in row])
+         inserted += max(self.cursor.rowcount or 0, 0)
+      return inserted
+
+   def get_all_transactions(self) -> list[Transaction]:
       """
       Retrieve all transactions with their accounting entries (legacy: returns all).
       
       Returns:
-         List of transaction dictionaries with accounting entries and account info.
+         List of Transaction rows with accounting entries and account info.
+      """
+      return list(self.iter_all_transactions())
+
+   def iter_all_transactions(self, chunk_size: int = 1000) -> Iterator[Transaction]:
       """
-      return self.get_all_transactions_paginated(page=1, page_size=1000000)['transactions']
+      Stream all transactions with their accounting entries, newest first.
+      
+      Rows are fetched in keyset-paginated chunks, so only one chunk (and its
+      batched accounting entries) is held in memory at a time. A server-side
+      streaming cursor is not used because the entries query of each chunk
+      has to run on the same connection.
+      
+      Args:
+         chunk_size: Number of transactions fetched per round-trip
+         
+      Yields:
+         Transaction rows with accounting entries and account info.
+      """
+      last_date = None
+      last_id = None
+      while True:
+         chunk = self.get_transactions_keyset(last_date=last_date, last_id=last_id, page_size=chunk_size)
+         yield from chunk['transactions']
+         if len(chunk['transactions']) < chunk_size:
+            break
+         last_date = chunk['last_date']
+         last_id = chunk['last_id']
+
+   def get_all_transactions_columnar(self) -> dict[str, tuple | dict]:
+      """
+      Retrieve all transactions newest first as columns instead of rows (bulk export).
+      
+      Each Transaction field except entries maps to one tuple holding that
+      column for all transactions, so no per-row object is built. Accounting
+      entries are loaded with a single query over the whole table.
+      
+      Returns:
+         Dict of column tuples keyed by Transaction field name, plus 'entries'
+         mapping transaction ID to its list of AccountingEntry rows.
+      """
+      self.cursor.execute("""
+         SELECT 
+            t.id,
+            t.dateImport,
+            t.dateValue,
+            t.description,
+            t.amount,
+            t.iban,
+            t.bic,
+            t.recipientApplicant,
+            a.id as account_id,
+            a.name as account_name,
+            a.iban_accountNumber
+         FROM tbl_transaction t
+         JOIN tbl_account a ON t.account = a.id
+         ORDER BY t.dateValue DESC, t.id DESC
+      """)
+      rows = self.cursor.fetchall()
+
+      # One C-level transpose instead of a Python object per row
+      fields = Transaction._fields[:-1]
+      columns = list(zip(*rows)) if rows else [()] * len(fields)
+      result = dict(zip(fields, columns))
+
+      self.cursor.execute("""
+         SELECT 
+            ae.transaction,
+            ae.id,
+            ae.dateImport,
+            ae.checked,
+            ae.amount,
+            ae.accountingPlanned,
+            ae.category,
+            vcf.fullname as category_name
+         FROM tbl_accountingEntry ae
+         LEFT JOIN view_categoryFullname vcf ON ae.category = vcf.id
+         ORDER BY ae.transaction, ae.dateImport DESC
+      """)
+      new = tuple.__new__
+      result['entries'] = {
+         transaction_id: [new(AccountingEntry, row[1:]) for row in group]
+         for transaction_id, group in groupby(self.cursor.fetchall(), itemgetter(0))
+      }
+      return result
 
    def get_all_transactions_paginated(
       self,
@@ -143,7 +509,9 @@ class TransactionRepository(BaseRepository):
       date_from: str = None,
       date_to: str = None,
       sort_by: str = None,
-      sort_dir: str = None
+      sort_dir: str = None,
+      fulltext: bool = False,
+      search_mode: str = "contains"
    ) -> dict:
       """
       Retrieve paginated transactions with their accounting entries.
@@ -158,6 +526,9 @@ class TransactionRepository(BaseRepository):
          date_to: Optional date filter (YYYY-MM-DD) to
          sort_by: Optional sort column ('date', 'description', 'amount', 'account', 'entries')
          sort_dir: Optional sort direction ('asc' or 'desc')
+         fulltext: Use the FULLTEXT index for 'contains' searches instead of LIKE '%term%'
+         search_mode: How plain search terms match: 'contains' (default, substring;
+            uses the FULLTEXT index of migration 003 when fulltext is set) or 'prefix' (index-usable)
 
       Returns:
          Dict with 'transactions' list, 'page', 'page_size', and 'total' count
@@ -166,86 +537,76 @@ class TransactionRepository(BaseRepository):
       page_size = min(max(1, page_size), 100000)  # Increased limit to 100k for get_all_transactions()
       offset = (page - 1) * page_size
       
-      # Build WHERE clauses for filtering
-      where_clauses = []
+      predicate_mode = None
       params = []
-      
-      # Search filter in SQL
       if search:
-         search_term = f"%{search}%"
-         where_clauses.append("""(
-            t.description LIKE %s OR 
-            t.recipientApplicant LIKE %s OR 
-            t.iban LIKE %s OR 
-            t.bic LIKE %s OR 
-            a.name LIKE %s OR
-            EXISTS (
-               SELECT 1 FROM tbl_accountingEntry ae 
-               LEFT JOIN tbl_category c ON ae.category = c.id 
-               WHERE ae.transaction = t.id AND c.name LIKE %s
-            )
-         )""")
-         params.extend([search_term] * 6)
-      
-      # Filter type in SQL  
-      if filter_type == "unchecked":
-         where_clauses.append("""EXISTS (
-            SELECT 1 FROM tbl_accountingEntry ae 
-            WHERE ae.transaction = t.id AND ae.checked = 0
-         )""")
-      elif filter_type == "no_entries":
-         where_clauses.append("""NOT EXISTS (
-            SELECT 1 FROM tbl_accountingEntry ae WHERE ae.transaction = t.id
-         )""")
-      elif filter_type == "uncategorized":
-         where_clauses.append("""EXISTS (
-            SELECT 1 FROM tbl_accountingEntry ae 
-            WHERE ae.transaction = t.id AND ae.category IS NULL
-         )""")
-      elif filter_type == "categorized_unchecked":
-         where_clauses.append("""EXISTS (
-            SELECT 1 FROM tbl_accountingEntry ae 
-            WHERE ae.transaction = t.id AND ae.category IS NOT NULL AND ae.checked = 0
-         )""")
-
+         predicate_mode, search_params = _search_mode_and_params(search, fulltext, search_mode)
+         params.extend(search_params)
       if account_id:
-         where_clauses.append("t.account = %s")
          params.append(account_id)
-
       if date_from:
-         where_clauses.append("t.dateValue >= %s")
          params.append(date_from)
-
       if date_to:
-         where_clauses.append("t.dateValue <= %s")
          params.append(date_to)
+
+      count_sql, sql = _build_transaction_page_sql(
+         predicate_mode,
+         filter_type if filter_type in _FILTER_HAVING else None,
+         bool(account_id),
+         bool(date_from),
+         bool(date_to),
+         sort_by if sort_by in _SORT_COLUMNS else None,
+         "ASC" if (sort_dir or "").lower() == "asc" else "DESC"
+      )
       
-      where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+      self.cursor.execute(sql, params + [page_size, offset])
       
-      # Get total count with filters
-      count_sql = f"SELECT COUNT(*) FROM tbl_transaction t JOIN tbl_account a ON t.account = a.id WHERE {where_sql}"
-      self.cursor.execute(count_sql, params)
-      total = self.cursor.fetchone()[0]
+      # Fetch all results first to avoid cursor conflicts
+      rows = self.cursor.fetchall()
       
-      sort_map = {
-         "date": "t.dateValue",
-         "description": "t.description",
-         "amount": "t.amount",
-         "account": "a.name",
-         "entries": "entries_count"
-      }
-      sort_column = sort_map.get(sort_by)
-      sort_direction = "DESC" if (sort_dir or "").lower() != "asc" else "ASC"
-
-      if sort_column:
-         if sort_column == "t.dateValue":
-            order_by = f"{sort_column} {sort_direction}, t.dateImport {sort_direction}"
-         else:
-            order_by = f"{sort_column} {sort_direction}, t.dateValue DESC, t.dateImport DESC"
+      # The total comes with the page rows; only a page past the end needs
+      # the separate count query
+      if rows:
+         total = rows[0][12]
+      elif offset:
+         self.cursor.execute(count_sql, params)
+         total = self.cursor.fetchone()[0]
       else:
-         order_by = "t.dateValue DESC, t.dateImport DESC"
+         total = 0
+      
+      return {
+         'transactions': self._build_transactions(rows),
+         'page': page,
+         'page_size': page_size,
+         'total': total
+      }
+
+   def get_transactions_keyset(
+      self,
+      last_date: datetime | str | None = None,
+      last_id: int | None = None,
+      page_size: int = 100
+   ) -> dict:
+      """
+      Retrieve transactions newest first using keyset pagination (no OFFSET).
+      
+      Args:
+         last_date: dateValue of the last transaction of the previous page (None for the first page)
+         last_id: ID of the last transaction of the previous page (None for the first page)
+         page_size: Number of records per page
+         
+      Returns:
+         Dict with 'transactions' list, 'page_size' and the 'last_date'/'last_id' keys for the next page
+      """
+      page_size = min(max(1, page_size), 100000)
+
+      where_sql = "1=1"
+      params = []
+      if last_date is not None and last_id is not None:
+         # Expanded form of (t.dateValue, t.id) < (%s, %s) so the dateValue index is used
+         where_sql = "(t.dateValue < %s OR (t.dateValue = %s AND t.id < %s))"
+         params.extend([last_date, last_date, last_id])
 
-      # Get paginated data with filters
       sql = f"""
          SELECT 
             t.id,
@@ -259,49 +620,52 @@ class TransactionRepository(BaseRepository):
             a.id as account_id,
             a.name as account_name,
             a.iban_accountNumber,
-            COALESCE(ec.entries_count, 0) as entries_count
-         FROM tbl_transaction t
+            EXISTS(SELECT 1 FROM tbl_accountingEntry ae_any WHERE ae_any.transaction = t.id) as has_entries
+         FROM (
+            SELECT t.id
+            FROM tbl_transaction t
+            WHERE {where_sql}
+            ORDER BY t.dateValue DESC, t.id DESC
+            LIMIT %s
+         ) p
+         JOIN tbl_transaction t ON t.id = p.id
          JOIN tbl_account a ON t.account = a.id
-         LEFT JOIN (
-            SELECT transaction, COUNT(*) AS entries_count
-            FROM tbl_accountingEntry
-            GROUP BY transaction
-         ) ec ON ec.transaction = t.id
-         WHERE {where_sql}
-         ORDER BY {order_by}
-         LIMIT %s OFFSET %s
+         ORDER BY t.dateValue DESC, t.id DESC
       """
-      self.cursor.execute(sql, params + [page_size, offset])
-      
-      # Fetch all results first to avoid cursor conflicts
+      self.cursor.execute(sql, params + [page_size])
       rows = self.cursor.fetchall()
-      
-      transactions = []
-      for row in rows:
-         transaction = {
-            "id": row[0],
-            "dateImport": row[1],
-            "dateValue": row[2],
-            "description": row[3],
-            "amount": row[4],
-            "iban": row[5],
-            "bic": row[6],
-            "recipientApplicant": row[7],
-            "account_id": row[8],
-            "account_name": row[9],
-            "account_iban": row[10],
-            "entries": self._get_accounting_entries(row[0])
-         }
-         transactions.append(transaction)
-      
+
       return {
-         'transactions': transactions,
-         'page': page,
+         'transactions': self._build_transactions(rows),
          'page_size': page_size,
-         'total': total
+         'last_date': rows[-1][2] if rows else None,
+         'last_id': rows[-1][0] if rows else None
       }
 
-   def get_transaction_by_id(self, transaction_id: int) -> dict | None:
+   def _build_transactions(self, rows: list[tuple]) -> list[Transaction]:
+      """
+      Build transaction rows for fetched rows including their accounting entries.
+      
+      Args:
+         rows: Transaction rows (id, dateImport, dateValue, description, amount, iban, bic,
+            recipientApplicant, account_id, account_name, iban_accountNumber, has_entries)
+         
+      Returns:
+         List of Transaction rows.
+      """
+      # Load the accounting entries of all rows in one round-trip, skipping
+      # transactions the row already reports as having none
+      entries_by_transaction = self._get_accounting_entries_for_transactions(
+         [row[0] for row in rows if row[11]]
+      )
+      
+      # tuple.__new__ builds the namedtuple without the per-row Python frame
+      # and length check of Transaction._make; the shape is fixed by the SQL
+      new = tuple.__new__
+      get_entries = entries_by_transaction.get
+      return [new(Transaction, row[:11] + (get_entries(row[0], []),)) for row in rows]
+
+   def get_transaction_by_id(self, transaction_id: int) -> Transaction | None:
       """
       Retrieve a single transaction with its accounting entries.
       
@@ -309,7 +673,7 @@ class TransactionRepository(BaseRepository):
          transaction_id: ID of the transaction
          
       Returns:
-         Transaction dictionary or None if not found.
+         Transaction row or None if not found.
       """
       sql = """
          SELECT 
@@ -323,7 +687,8 @@ class TransactionRepository(BaseRepository):
             t.recipientApplicant,
             a.id as account_id,
             a.name as account_name,
-            a.iban_accountNumber
+            a.iban_accountNumber,
+            EXISTS(SELECT 1 FROM tbl_accountingEntry ae_any WHERE ae_any.transaction = t.id) as has_entries
          FROM tbl_transaction t
          JOIN tbl_account a ON t.account = a.id
          WHERE t.id = %s
@@ -334,24 +699,10 @@ class TransactionRepository(BaseRepository):
       if not row:
          return None
          
-      transaction = {
-         "id": row[0],
-         "dateImport": row[1],
-         "dateValue": row[2],
-         "description": row[3],
-         "amount": row[4],
-         "iban": row[5],
-         "bic": row[6],
-         "recipientApplicant": row[7],
-         "account_id": row[8],
-         "account_name": row[9],
-         "account_iban": row[10],
-         "entries": self._get_accounting_entries(row[0])
-      }
-      
-      return transaction
+      entries = self._get_accounting_entries(row[0]) if row[11] else []
+      return Transaction._make((*row[:11], entries))
 
-   def _get_accounting_entries(self, transaction_id: int) -> list[dict]:
+   def _get_accounting_entries(self, transaction_id: int) -> list[AccountingEntry]:
       """
       Retrieve accounting entries for a transaction.
       
@@ -359,10 +710,33 @@ class TransactionRepository(BaseRepository):
          transaction_id: ID of the transaction
          
       Returns:
-         List of accounting entry dictionaries.
+         List of AccountingEntry rows.
       """
-      sql = """
+      self.cursor.execute(_ACCOUNTING_ENTRIES_SQL, (transaction_id,))
+      
+      # Fetch all results
+      rows = self.cursor.fetchall()
+      
+      return [AccountingEntry._make(row) for row in rows]
+
+   def _get_accounting_entries_for_transactions(self, transaction_ids: list[int]) -> dict[int, list[AccountingEntry]]:
+      """
+      Retrieve accounting entries for several transactions with a single query.
+      
+      Args:
+         transaction_ids: IDs of the transactions
+         
+      Returns:
+         Dictionary mapping transaction ID to its list of AccountingEntry rows.
+      """
+      entries_by_transaction = defaultdict(list)
+      if not transaction_ids:
+         return entries_by_transaction
+
+      placeholders = ", ".join(["%s"] * len(transaction_ids))
+      sql = f"""
          SELECT 
+            ae.transaction,
             ae.id,
             ae.dateImport,
             ae.checked,
@@ -372,25 +746,14 @@ class TransactionRepository(BaseRepository):
             vcf.fullname as category_name
          FROM tbl_accountingEntry ae
          LEFT JOIN view_categoryFullname vcf ON ae.category = vcf.id
-         WHERE ae.transaction = %s
-         ORDER BY ae.dateImport DESC
+         WHERE ae.transaction IN ({placeholders})
+         ORDER BY ae.transaction, ae.dateImport DESC
       """
-      self.cursor.execute(sql, (transaction_id,))
-      
-      # Fetch all results
-      rows = self.cursor.fetchall()
-      
-      entries = []
-      for row in rows:
-         entry = {
-            "id": row[0],
-            "dateImport": row[1],
-            "checked": row[2],
-            "amount": row[3],
-            "accountingPlanned": row[4],
-            "category": row[5],
-            "category_name": row[6]
-         }
-         entries.append(entry)
-      
-      return entries
+      self.cursor.execute(sql, list(transaction_ids))
+
+      # Rows arrive grouped by transaction, so each list is built in one go
+      new = tuple.__new__
+      for transaction_id, group in groupby(self.cursor.fetchall(), itemgetter(0)):
+         entries_by_transaction[transaction_id] = [new(AccountingEntry, row[1:]) for row in group]
+
+      return entries_by_transaction
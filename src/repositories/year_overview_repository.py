@@ -8,8 +8,12 @@
 #
 from __future__ import annotations
 
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Tuple
+from typing import Callable, Mapping, Tuple
+
+from mysql.connector.errors import PoolError
 
 from repositories.base import BaseRepository
 from repositories.error_handling import execute_fetchall_with_retry
@@ -30,421 +34,243 @@ MONTH_NAMES = [
 ]
 
 
-def _account_balance_month_expr(label: str, comparator: str) -> str:
-    return f"""
-              (
-                COALESCE((SELECT SUM(ae.amount)
-                          FROM tbl_transaction t2
-                          LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                          WHERE t2.account = a.id AND t2.dateValue <= %s
-                            AND EXTRACT(YEAR_MONTH FROM t2.dateValue) {comparator} %s), 0)
-              + COALESCE((SELECT SUM(p.amount)
-                          FROM tbl_planning p
-                          JOIN tbl_planningEntry pe ON pe.planning = p.id
-                          WHERE p.account = a.id AND pe.dateValue > %s
-                            AND EXTRACT(YEAR_MONTH FROM pe.dateValue) {comparator} %s), 0)
-              + a.startAmount
-              ) AS {label}
+# Per-account monthly flows: booked amounts up to today plus planned amounts
+# after today, each pre-aggregated once per (account, YYYYMM). UNION ALL keeps
+# the sources from multiplying each other when joined to tbl_account.
+_LIVE_BOOKED_FLOW_SQL = """
+              SELECT t.account, EXTRACT(YEAR_MONTH FROM t.dateValue) AS ym, SUM(ae.amount) AS amt
+              FROM tbl_transaction t
+              JOIN tbl_accountingEntry ae ON ae.transaction = t.id
+              WHERE t.dateValue <= %(today)s {tx_range}
+              GROUP BY t.account, ym"""
+
+# Materialized variant: completed months come from tbl_accountMonthFlow
+# (migration 007, kept current by triggers); only the current month up to
+# today is aggregated live
+_MATERIALIZED_BOOKED_FLOW_SQL = """
+              SELECT mf.account, mf.ym, mf.amount AS amt
+              FROM tbl_accountMonthFlow mf
+              WHERE mf.ym < EXTRACT(YEAR_MONTH FROM %(today)s) {mv_range}
+              UNION ALL
+              SELECT t.account, EXTRACT(YEAR_MONTH FROM t.dateValue) AS ym, SUM(ae.amount) AS amt
+              FROM tbl_transaction t
+              JOIN tbl_accountingEntry ae ON ae.transaction = t.id
+              WHERE t.dateValue >= DATE_SUB(%(today)s, INTERVAL DAYOFMONTH(%(today)s) - 1 DAY)
+                AND t.dateValue <= %(today)s {tx_range}
+              GROUP BY t.account, ym"""
+
+_PLANNED_FLOW_SQL = """
+              SELECT p.account, EXTRACT(YEAR_MONTH FROM pe.dateValue) AS ym, SUM(p.amount) AS amt
+              FROM tbl_planning p
+              JOIN tbl_planningEntry pe ON pe.planning = p.id
+              WHERE pe.dateValue > %(today)s {pe_range}
+              GROUP BY p.account, ym"""
+
+
+def _flow_cte(materialized: bool, year_only: bool = False) -> str:
     """
-
-
-def _account_balance_delta_month_expr(label: str, comparator: str) -> str:
-    return f"""
-              (
-                COALESCE((SELECT SUM(ae.amount) FROM tbl_transaction t2
-                          LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                          WHERE t2.account = a.id AND t2.dateValue <= %s
-                            AND EXTRACT(YEAR_MONTH FROM t2.dateValue) {comparator} %s), 0)
-              + COALESCE((SELECT SUM(p.amount) FROM tbl_planning p
-                          JOIN tbl_planningEntry pe ON pe.planning = p.id
-                          WHERE p.account = a.id AND pe.dateValue > %s
-                            AND EXTRACT(YEAR_MONTH FROM pe.dateValue) {comparator} %s), 0)
-              ) AS {label}
+    WITH clause defining the flow(account, ym, amt) CTE.
+    
+    Every overview column only sums flows up to the end of the requested
+    year, so all sources stop at next_year_start. Which sources can still
+    contribute is thereby decided by the bound parameters: for a past year
+    the planned range (today, next_year_start) is empty and only booked
+    history is read, without a per-month CASE in the statement.
+    
+    Args:
+        materialized: Read completed months from tbl_accountMonthFlow
+        year_only: Also drop flows before year_start
     """
+    tx_range = "AND t.dateValue < %(next_year_start)s"
+    pe_range = "AND pe.dateValue < %(next_year_start)s"
+    mv_range = "AND mf.ym <= %(ym_last)s"
+    if year_only:
+        tx_range += " AND t.dateValue >= %(year_start)s"
+        pe_range += " AND pe.dateValue >= %(year_start)s"
+        mv_range = "AND mf.ym BETWEEN %(ym_first)s AND %(ym_last)s"
+
+    booked_sql = _MATERIALIZED_BOOKED_FLOW_SQL if materialized else _LIVE_BOOKED_FLOW_SQL
+    return f"""
+            WITH flow AS ({booked_sql.format(tx_range=tx_range, mv_range=mv_range)}
+              UNION ALL{_PLANNED_FLOW_SQL.format(pe_range=pe_range)}
+            )
+"""
 
 
-def _extend_month_params(params: list, today: date, month_values: list[int]) -> None:
-    for month_value in month_values:
-        params.extend([today, month_value, today, month_value])
+def _month_params(year: int) -> dict:
+    """Named bounds of a year: YYYYMM m01..m12 and ym_first/ym_last, dates year_start/next_year_start."""
+    params = {f"m{month:02d}": year * 100 + month for month in range(1, 13)}
+    params["ym_first"] = year * 100 + 1
+    params["ym_last"] = year * 100 + 12
+    params["year_start"] = date(year, 1, 1)
+    params["next_year_start"] = date(year + 1, 1, 1)
+    return params
 
 
-class YearOverviewRepository(BaseRepository):
-    def _fetch_dicts(self, query: str, params: Tuple) -> list[dict]:
-        rows, description = execute_fetchall_with_retry(self.cursor, query, params, retries=1)
-        columns = [col[0] for col in description]
-        return [dict(zip(columns, row)) for row in rows]
+def _month_threshold_case(label: str, comparator: str, bound: str, start_amount: bool = False) -> str:
+    """Conditional sum of the flows whose month compares to the named YYYYMM parameter bound."""
+    expr = f"COALESCE(SUM(CASE WHEN f.ym {comparator} %({bound})s THEN f.amt END), 0)"
+    if start_amount:
+        expr += " + a.startAmount"
+    return f"{expr} AS {label}"
 
-    def get_available_years(self) -> list[int]:
-        query = """
-            SELECT DISTINCT YEAR(tbl_transaction.dateValue) AS year
-            FROM tbl_transaction
-            WHERE YEAR(tbl_transaction.dateValue) <= (YEAR(CURDATE())+1)
-            ORDER BY YEAR(tbl_transaction.dateValue) DESC
-        """
-        self.cursor.execute(query)
-        rows = self.cursor.fetchall()
-        return [row[0] for row in rows]
 
-    def get_account_balances(self, year: int) -> list[dict]:
-        today = date.today()
-        month_thresholds = [year * 100 + month for month in range(1, 13)]
-        year_end_threshold = year * 100 + 12
+def _account_month_end_branch() -> str:
+    """
+    Month-end balances of the investment and loan accounts, tagged with their table.
+    
+    Booked flows only reach up to today and planned flows only start after
+    it, so "all flows up to month m" yields the booked balance for past
+    months and the booked + planned balance for future months.
+    """
+    month_sql = ",\n              ".join(
+        _month_threshold_case(label, "<=", f"m{month:02d}", start_amount=True)
+        for month, label in enumerate(MONTH_NAMES, 1)
+    )
+    return f"""
+            SELECT
+              CASE WHEN a.type = %(investment_type)s THEN 'investments' ELSE 'loans' END AS source,
+              0 AS seq,
+              a.name AS label,
+              {month_sql},
+              COALESCE(SUM(CASE WHEN f.ym BETWEEN %(ym_first)s AND %(ym_last)s THEN f.amt END), 0) AS Jahresbilanz
+            FROM tbl_account a
+            LEFT JOIN flow f ON f.account = a.id
+            WHERE a.dateStart < %(next_year_start)s
+              AND (a.dateEnd >= %(year_start)s OR ISNULL(a.dateEnd))
+              AND a.type IN (%(investment_type)s, %(loan_type)s)
+            GROUP BY a.id, a.name, a.startAmount, a.type
+    """
 
-        month_sql = ",\n".join(
-            _account_balance_month_expr(label, "<") for label in MONTH_NAMES
-        )
 
-        query = f"""
+def _build_account_balances_sql(materialized: bool) -> str:
+    """Balances of the current accounts at the start of each month and at year end."""
+    month_sql = ",\n              ".join(
+        _month_threshold_case(label, "<", f"m{month:02d}", start_amount=True)
+        for month, label in enumerate(MONTH_NAMES, 1)
+    )
+    return _flow_cte(materialized) + f"""
             SELECT
               a.name AS Konto,
               {month_sql},
-              (
-                COALESCE((SELECT SUM(ae.amount)
-                          FROM tbl_transaction t2
-                          LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                          WHERE t2.account = a.id
-                            AND t2.dateValue <= %s
-                            AND EXTRACT(YEAR_MONTH FROM t2.dateValue) <= %s), 0)
-              + COALESCE((SELECT SUM(p.amount)
-                          FROM tbl_planning p
-                          JOIN tbl_planningEntry pe ON pe.planning = p.id
-                          WHERE p.account = a.id
-                            AND pe.dateValue > %s
-                            AND EXTRACT(YEAR_MONTH FROM pe.dateValue) <= %s), 0)
-              + a.startAmount
-              ) AS Jahresabschluss
+              {_month_threshold_case("Jahresabschluss", "<=", "ym_last", start_amount=True)}
             FROM tbl_account a
-            WHERE YEAR(a.dateStart) <= %s
-              AND (YEAR(a.dateEnd) >= %s OR ISNULL(a.dateEnd))
+            LEFT JOIN flow f ON f.account = a.id
+            WHERE a.dateStart < %(next_year_start)s
+              AND (a.dateEnd >= %(year_start)s OR ISNULL(a.dateEnd))
               AND a.type IN (1)
+            GROUP BY a.id, a.name, a.startAmount
             ORDER BY Konto ASC
         """
 
-        params = []
-        _extend_month_params(params, today, month_thresholds)
-        params.extend([today, year_end_threshold, today, year_end_threshold])
-        params.extend([year, year])
-
-        return self._fetch_dicts(query, tuple(params))
-
-    def get_account_balances_monthly(self, year: int) -> list[dict]:
-        today = date.today()
-        month_equals = [year * 100 + month for month in range(1, 13)]
 
-        month_sql = ",\n".join(
-            _account_balance_delta_month_expr(label, "=") for label in MONTH_NAMES
-        )
-
-        query = f"""
+def _build_account_balances_monthly_sql(materialized: bool) -> str:
+    """Net flow of the current accounts per month and for the whole year."""
+    month_sql = ",\n              ".join(
+        _month_threshold_case(label, "=", f"m{month:02d}")
+        for month, label in enumerate(MONTH_NAMES, 1)
+    )
+    # Only flows of the requested year contribute, so all sources are
+    # limited to it with a sargable range
+    return _flow_cte(materialized, year_only=True) + f"""
             SELECT
               a.name AS Konto,
               {month_sql},
-              (
-                COALESCE((SELECT SUM(ae.amount) FROM tbl_transaction t2
-                          LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                          WHERE t2.account = a.id AND t2.dateValue <= %s AND YEAR(t2.dateValue) = %s), 0)
-              + COALESCE((SELECT SUM(p.amount) FROM tbl_planning p
-                          JOIN tbl_planningEntry pe ON pe.planning = p.id
-                          WHERE p.account = a.id AND pe.dateValue > %s AND YEAR(pe.dateValue) = %s), 0)
-              ) AS Jahresbilanz
+              COALESCE(SUM(f.amt), 0) AS Jahresbilanz
             FROM tbl_account a
-            WHERE YEAR(a.dateStart) <= %s
-              AND (YEAR(a.dateEnd) >= %s OR ISNULL(a.dateEnd))
+            LEFT JOIN flow f ON f.account = a.id
+            WHERE a.dateStart < %(next_year_start)s
+              AND (a.dateEnd >= %(year_start)s OR ISNULL(a.dateEnd))
               AND a.type IN (1)
+            GROUP BY a.id, a.name
             ORDER BY Konto ASC
         """
 
-        params = []
-        _extend_month_params(params, today, month_equals)
-        params.extend([today, year, today, year])
-        params.extend([year, year])
 
-        return self._fetch_dicts(query, tuple(params))
+# The statement texts only depend on MONTH_NAMES; everything year- or
+# date-dependent is a named parameter, so they are composed once at import
+# (one variant each for live and materialized booked flows).
+# They are deliberately not server-side prepared: each runs once per request,
+# the session pools reset connections on checkin (which deallocates prepared
+# statements), and MariaDB re-optimizes a prepared statement on every
+# EXECUTE anyway.
+_ACCOUNT_BALANCES_SQL = {m: _build_account_balances_sql(m) for m in (False, True)}
+_ACCOUNT_BALANCES_MONTHLY_SQL = {m: _build_account_balances_monthly_sql(m) for m in (False, True)}
 
-    def get_investments(self, year: int) -> list[dict]:
-        today = date.today()
-        month_dates = [f"{year}-{month:02d}-01" for month in range(1, 13)]
-
-        def month_column(label: str, month_date: str) -> str:
-            return f"""
-            (
-              CASE
-                WHEN LAST_DAY(%s) <= %s THEN
-                  COALESCE((SELECT SUM(ae.amount)
-                            FROM tbl_transaction t2
-                            LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                            WHERE t2.account = tbl_account.id
-                              AND t2.dateValue <= LAST_DAY(%s)), 0)
-                  + tbl_account.startAmount
-                ELSE
-                  COALESCE((SELECT SUM(ae.amount)
-                            FROM tbl_transaction t2
-                            LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                            WHERE t2.account = tbl_account.id
-                              AND t2.dateValue <= %s), 0)
-                  + COALESCE((SELECT SUM(p.amount)
-                              FROM tbl_planning p
-                              JOIN tbl_planningEntry pe ON pe.planning = p.id
-                              WHERE p.account = tbl_account.id
-                                AND pe.dateValue > %s
-                                AND pe.dateValue <= LAST_DAY(%s)), 0)
-                  + tbl_account.startAmount
-              END
-            ) AS {label}
-            """
-
-        month_sql_parts = [
-            month_column("Januar", month_dates[0]),
-            month_column("Februar", month_dates[1]),
-            month_column("März", month_dates[2]),
-            month_column("April", month_dates[3]),
-            month_column("Mai", month_dates[4]),
-            month_column("Juni", month_dates[5]),
-            month_column("Juli", month_dates[6]),
-            month_column("August", month_dates[7]),
-            month_column("September", month_dates[8]),
-            month_column("Oktober", month_dates[9]),
-            month_column("November", month_dates[10]),
-            month_column("Dezember", month_dates[11]),
-        ]
-
-        month_sql = ",\n          ".join(month_sql_parts)
-
-        query = f"""
-            SELECT
-              tbl_account.name AS Konto,
-              {month_sql},
-              (
-                COALESCE((SELECT SUM(ae.amount)
-                          FROM tbl_transaction t2
-                          LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                          WHERE t2.account = tbl_account.id
-                            AND t2.dateValue <= %s
-                            AND YEAR(t2.dateValue) = %s), 0)
-                + COALESCE((SELECT SUM(p.amount)
-                            FROM tbl_planning p
-                            JOIN tbl_planningEntry pe ON pe.planning = p.id
-                            WHERE p.account = tbl_account.id
-                              AND pe.dateValue > %s
-                              AND YEAR(pe.dateValue) = %s), 0)
-              ) AS Jahresbilanz
-            FROM tbl_account
-            WHERE YEAR(tbl_account.dateStart) <= %s
-              AND (YEAR(tbl_account.dateEnd) >= %s OR ISNULL(tbl_account.dateEnd))
-              AND tbl_account.type = 5
-            ORDER BY Konto ASC
+_AVAILABLE_YEARS_SQL = """
+            SELECT DISTINCT YEAR(tbl_transaction.dateValue) AS year
+            FROM tbl_transaction
+            WHERE tbl_transaction.dateValue < MAKEDATE(YEAR(CURDATE()) + 2, 1)
+            ORDER BY year DESC
         """
 
-        params = []
-        for month_date in month_dates:
-            params.extend([month_date, today, month_date, today, today, month_date])
-
-        params.extend([today, year, today, year, year, year])
+# Month columns come pre-pivoted from view_shareYearlyPivot (migration 008)
+_SECURITY_MONTH_COLUMNS = ",\n                ".join(
+    f"COALESCE(p.`{name}`, 0) AS `{name}`" for name in MONTH_NAMES
+)
 
-        return self._fetch_dicts(query, tuple(params))
-
-    def get_loans(self, year: int) -> list[dict]:
-        today = date.today()
-        month_dates = [f"{year}-{month:02d}-01" for month in range(1, 13)]
-
-        def month_column(label: str, month_date: str) -> str:
-            return f"""
-            (
-              CASE
-                WHEN LAST_DAY(%s) <= %s THEN
-                  COALESCE((SELECT SUM(ae.amount)
-                            FROM tbl_transaction t2
-                            LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                            WHERE t2.account = tbl_account.id
-                              AND t2.dateValue <= LAST_DAY(%s)), 0)
-                  + tbl_account.startAmount
-                ELSE
-                  COALESCE((SELECT SUM(ae.amount)
-                            FROM tbl_transaction t2
-                            LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                            WHERE t2.account = tbl_account.id
-                              AND t2.dateValue <= %s), 0)
-                  + COALESCE((SELECT SUM(p.amount)
-                              FROM tbl_planning p
-                              JOIN tbl_planningEntry pe ON pe.planning = p.id
-                              WHERE p.account = tbl_account.id
-                                AND pe.dateValue > %s
-                                AND pe.dateValue <= LAST_DAY(%s)), 0)
-                  + tbl_account.startAmount
-              END
-            ) AS {label}
-            """
-
-        month_sql_parts = [
-            month_column("Januar", month_dates[0]),
-            month_column("Februar", month_dates[1]),
-            month_column("März", month_dates[2]),
-            month_column("April", month_dates[3]),
-            month_column("Mai", month_dates[4]),
-            month_column("Juni", month_dates[5]),
-            month_column("Juli", month_dates[6]),
-            month_column("August", month_dates[7]),
-            month_column("September", month_dates[8]),
-            month_column("Oktober", month_dates[9]),
-            month_column("November", month_dates[10]),
-            month_column("Dezember", month_dates[11]),
-        ]
-
-        month_sql = ",\n          ".join(month_sql_parts)
-
-        query = f"""
+_SECURITIES_OVERVIEW_SQL = f"""
             SELECT
-              tbl_account.name AS Konto,
-              {month_sql},
-              (
-                COALESCE((SELECT SUM(ae.amount)
-                          FROM tbl_transaction t2
-                          LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                          WHERE t2.account = tbl_account.id
-                            AND t2.dateValue <= %s
-                            AND YEAR(t2.dateValue) = %s), 0)
-                + COALESCE((SELECT SUM(p.amount)
-                            FROM tbl_planning p
-                            JOIN tbl_planningEntry pe ON pe.planning = p.id
-                            WHERE p.account = tbl_account.id
-                              AND pe.dateValue > %s
-                              AND YEAR(pe.dateValue) = %s), 0)
-              ) AS Jahresbilanz
-            FROM tbl_account
-            WHERE YEAR(tbl_account.dateStart) <= %s
-              AND (YEAR(tbl_account.dateEnd) >= %s OR ISNULL(tbl_account.dateEnd))
-              AND tbl_account.type = 3
-            ORDER BY Konto ASC
-        """
-
-        params = []
-        for month_date in month_dates:
-            params.extend([month_date, today, month_date, today, today, month_date])
-
-        params.extend([today, year, today, year, year, year])
-
-        return self._fetch_dicts(query, tuple(params))
-
-    def get_securities_overview(self, year: int) -> list[dict]:
-        query = """
-            SELECT 
-                vsms.share_name AS Wertpapier,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 1 THEN vsms.portfolio_value END), 0) AS Januar,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 2 THEN vsms.portfolio_value END), 0) AS Februar,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 3 THEN vsms.portfolio_value END), 0) AS März,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 4 THEN vsms.portfolio_value END), 0) AS April,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 5 THEN vsms.portfolio_value END), 0) AS Mai,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 6 THEN vsms.portfolio_value END), 0) AS Juni,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 7 THEN vsms.portfolio_value END), 0) AS Juli,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 8 THEN vsms.portfolio_value END), 0) AS August,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 9 THEN vsms.portfolio_value END), 0) AS September,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 10 THEN vsms.portfolio_value END), 0) AS Oktober,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 11 THEN vsms.portfolio_value END), 0) AS November,
-                COALESCE(MAX(CASE WHEN MONTH(vsms.month_end_date) = 12 THEN vsms.portfolio_value END), 0) AS Dezember,
+                p.share_name AS Wertpapier,
+                {_SECURITY_MONTH_COLUMNS},
                 COALESCE(
                     (SELECT SUM(ae.amount)
                      FROM tbl_shareTransaction st
                      JOIN tbl_accountingEntry ae ON st.accountingEntry = ae.id
                      JOIN tbl_category cat ON ae.category = cat.id
                      JOIN tbl_transaction t ON ae.transaction = t.id
-                     WHERE st.share = vsms.share_id
+                     WHERE st.share = p.share_id
                        AND cat.name = 'Dividende (Wertpapiere)'
-                       AND YEAR(t.dateValue) = %s
+                       AND t.dateValue >= %(year_start)s
+                       AND t.dateValue < %(next_year_start)s
                     ), 0
                 ) AS Dividende
-            FROM view_shareMonthlySnapshot vsms
-            WHERE YEAR(vsms.month_end_date) = %s
-            GROUP BY vsms.share_id, vsms.share_name
-            HAVING MAX(vsms.volume) > 0
-            ORDER BY vsms.share_name ASC
+            FROM view_shareYearlyPivot p
+            WHERE p.year = %(year)s
+              AND p.max_volume > 0
+            ORDER BY p.share_name ASC
         """
 
-        params = (year, year)
-        return self._fetch_dicts(query, params)
 
-    def get_assets_month_end(self, year: int) -> list[dict]:
-        today = date.today()
-        month_dates = [f"{year}-{month:02d}-01" for month in range(1, 13)]
-
-        def month_sum_column(label: str, month_date: str, account_type_name: str) -> str:
-            return f"""
-            (
-              CASE
-                WHEN LAST_DAY(%s) <= %s THEN
-                  COALESCE((SELECT SUM(ae.amount)
-                            FROM tbl_transaction t2
-                            LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                            INNER JOIN tbl_account a ON a.id = t2.account
-                            INNER JOIN tbl_accountType at ON at.id = a.type
-                            WHERE at.type = %s
-                              AND t2.dateValue <= LAST_DAY(%s)
-                          ), 0)
-                  + COALESCE((SELECT SUM(a.startAmount)
-                              FROM tbl_account a
-                              INNER JOIN tbl_accountType at ON at.id = a.type
-                              WHERE at.type = %s
-                            ), 0)
-                ELSE
-                  COALESCE((SELECT SUM(ae.amount)
-                            FROM tbl_transaction t2
-                            LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                            INNER JOIN tbl_account a ON a.id = t2.account
-                            INNER JOIN tbl_accountType at ON at.id = a.type
-                            WHERE at.type = %s
-                              AND t2.dateValue <= %s
-                          ), 0)
-                  + COALESCE((SELECT SUM(p.amount)
-                              FROM tbl_planning p
-                              JOIN tbl_planningEntry pe ON pe.planning = p.id
-                              INNER JOIN tbl_account a ON a.id = p.account
-                              INNER JOIN tbl_accountType at ON at.id = a.type
-                              WHERE at.type = %s
-                                AND pe.dateValue > %s
-                                AND pe.dateValue <= LAST_DAY(%s)
-                            ), 0)
-                  + COALESCE((SELECT SUM(a.startAmount)
-                              FROM tbl_account a
-                              INNER JOIN tbl_accountType at ON at.id = a.type
-                              WHERE at.type = %s
-                            ), 0)
-              END
-            ) AS {label}
-            """
-
-        giro_month_sql_parts = [
-            month_sum_column("Januar", month_dates[0], "Girokonto"),
-            month_sum_column("Februar", month_dates[1], "Girokonto"),
-            month_sum_column("März", month_dates[2], "Girokonto"),
-            month_sum_column("April", month_dates[3], "Girokonto"),
-            month_sum_column("Mai", month_dates[4], "Girokonto"),
-            month_sum_column("Juni", month_dates[5], "Girokonto"),
-            month_sum_column("Juli", month_dates[6], "Girokonto"),
-            month_sum_column("August", month_dates[7], "Girokonto"),
-            month_sum_column("September", month_dates[8], "Girokonto"),
-            month_sum_column("Oktober", month_dates[9], "Girokonto"),
-            month_sum_column("November", month_dates[10], "Girokonto"),
-            month_sum_column("Dezember", month_dates[11], "Girokonto"),
-        ]
-
-        darlehen_month_sql_parts = [
-            month_sum_column("Januar", month_dates[0], "Darlehen"),
-            month_sum_column("Februar", month_dates[1], "Darlehen"),
-            month_sum_column("März", month_dates[2], "Darlehen"),
-            month_sum_column("April", month_dates[3], "Darlehen"),
-            month_sum_column("Mai", month_dates[4], "Darlehen"),
-            month_sum_column("Juni", month_dates[5], "Darlehen"),
-            month_sum_column("Juli", month_dates[6], "Darlehen"),
-            month_sum_column("August", month_dates[7], "Darlehen"),
-            month_sum_column("September", month_dates[8], "Darlehen"),
-            month_sum_column("Oktober", month_dates[9], "Darlehen"),
-            month_sum_column("November", month_dates[10], "Darlehen"),
-            month_sum_column("Dezember", month_dates[11], "Darlehen"),
-        ]
-
-        giro_month_sql = ",\n          ".join(giro_month_sql_parts)
-        darlehen_month_sql = ",\n          ".join(darlehen_month_sql_parts)
-
-        securities_month_sql = """
+# Flows summed per account type name (tbl_accountType.type) and month
+_TYPE_FLOW_CTE = """,
+            type_flow AS (
+              SELECT at.type AS tp, f.ym, SUM(f.amt) AS amt
+              FROM flow f
+              JOIN tbl_account a ON a.id = f.account
+              JOIN tbl_accountType at ON at.id = a.type
+              GROUP BY at.type, f.ym
+            )
+"""
+
+
+def _type_month_end_branch(label: str, type_name: str) -> str:
+    """
+    One summary row of month-end balances over all accounts of one type name.
+    
+    The type name is bound as the named parameter type_name; the month
+    bounds are those of _month_params.
+    """
+    month_sql = ",\n                   ".join(
+        f"COALESCE(SUM(CASE WHEN tf.ym <= %(m{month:02d})s THEN tf.amt END), 0) + st.startAmount AS {month_name}"
+        for month, month_name in enumerate(MONTH_NAMES, 1)
+    )
+    return f"""
+            SELECT '{label}' AS `Vermögen Ende des Monats`,
+                   {month_sql},
+                   COALESCE(SUM(CASE WHEN tf.ym BETWEEN %(ym_first)s AND %(ym_last)s THEN tf.amt END), 0) AS Jahresbilanz
+            FROM (
+              SELECT COALESCE(SUM(a.startAmount), 0) AS startAmount
+              FROM tbl_account a
+              INNER JOIN tbl_accountType at ON at.id = a.type
+              WHERE at.type = %({type_name})s
+            ) st
+            LEFT JOIN type_flow tf ON tf.tp = %({type_name})s
+            GROUP BY st.startAmount
+    """
+
+
+_SECURITIES_MONTH_SQL = """
             COALESCE(MAX(CASE WHEN MONTH(month_end_date) = 1 THEN portfolio_value_sum END), 0) AS Januar,
             COALESCE(MAX(CASE WHEN MONTH(month_end_date) = 2 THEN portfolio_value_sum END), 0) AS Februar,
             COALESCE(MAX(CASE WHEN MONTH(month_end_date) = 3 THEN portfolio_value_sum END), 0) AS März,
@@ -457,155 +283,242 @@ class YearOverviewRepository(BaseRepository):
             COALESCE(MAX(CASE WHEN MONTH(month_end_date) = 10 THEN portfolio_value_sum END), 0) AS Oktober,
             COALESCE(MAX(CASE WHEN MONTH(month_end_date) = 11 THEN portfolio_value_sum END), 0) AS November,
             COALESCE(MAX(CASE WHEN MONTH(month_end_date) = 12 THEN portfolio_value_sum END), 0) AS Dezember
-        """
+"""
 
-        def year_begin_sum_subselect(account_type_name: str) -> str:
-            return f"""
-              (SELECT
-                COALESCE((SELECT SUM(a.startAmount)
-                          FROM tbl_account a
-                          INNER JOIN tbl_accountType at ON at.id = a.type
-                          WHERE at.type = %s), 0)
-                + COALESCE((SELECT SUM(ae.amount)
-                            FROM tbl_transaction t2
-                            LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                            INNER JOIN tbl_account a ON a.id = t2.account
-                            INNER JOIN tbl_accountType at ON at.id = a.type
-                            WHERE at.type = %s
-                              AND t2.dateValue < %s), 0))
-            """
-
-        def year_end_sum_expr(account_type_name: str) -> str:
-            return f"""
-            (
-              CASE
-                WHEN LAST_DAY(%s) <= %s THEN
-                  COALESCE((SELECT SUM(ae.amount)
-                            FROM tbl_transaction t2
-                            LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                            INNER JOIN tbl_account a ON a.id = t2.account
-                            INNER JOIN tbl_accountType at ON at.id = a.type
-                            WHERE at.type = %s
-                              AND t2.dateValue <= LAST_DAY(%s)), 0)
-                  + COALESCE((SELECT SUM(a.startAmount)
-                              FROM tbl_account a
-                              INNER JOIN tbl_accountType at ON at.id = a.type
-                              WHERE at.type = %s), 0)
-                ELSE
-                  COALESCE((SELECT SUM(ae.amount)
-                            FROM tbl_transaction t2
-                            LEFT JOIN tbl_accountingEntry ae ON ae.transaction = t2.id
-                            INNER JOIN tbl_account a ON a.id = t2.account
-                            INNER JOIN tbl_accountType at ON at.id = a.type
-                            WHERE at.type = %s AND t2.dateValue <= %s), 0)
-                  + COALESCE((SELECT SUM(p.amount)
-                              FROM tbl_planning p
-                              JOIN tbl_planningEntry pe ON pe.planning = p.id
-                              INNER JOIN tbl_account a ON a.id = p.account
-                              INNER JOIN tbl_accountType at ON at.id = a.type
-                              WHERE at.type = %s AND pe.dateValue > %s AND YEAR(pe.dateValue) = %s), 0)
-                  + COALESCE((SELECT SUM(a.startAmount)
-                              FROM tbl_account a
-                              INNER JOIN tbl_accountType at ON at.id = a.type
-                              WHERE at.type = %s), 0)
-              END
-            )
-            """
-
-        query = f"""
-            SELECT 'Kontostand' AS `Vermögen Ende des Monats`,
-                   {giro_month_sql},
-                   (
-                     {year_end_sum_expr('Girokonto')}
-                     - {year_begin_sum_subselect('Girokonto')}
-                   ) AS Jahresbilanz
-            UNION ALL
-            SELECT 'Darlehen' AS `Vermögen Ende des Monats`,
-                   {darlehen_month_sql},
-                   (
-                     {year_end_sum_expr('Darlehen')}
-                     - {year_begin_sum_subselect('Darlehen')}
-                   ) AS Jahresbilanz
-            UNION ALL
+_SECURITIES_MONTH_END_BRANCH = f"""
             SELECT 'Wertpapiere' AS `Vermögen Ende des Monats`,
-                   {securities_month_sql},
+                   {_SECURITIES_MONTH_SQL},
                    COALESCE(MAX(CASE WHEN MONTH(month_end_date) = 12 THEN portfolio_value_sum END), 0)
                    - COALESCE((SELECT SUM(portfolio_value)
                                FROM view_shareMonthlySnapshot
-                               WHERE YEAR(month_end_date) = %s AND MONTH(month_end_date) = 12), 0) AS Jahresbilanz
+                               WHERE month_end_date = %(prev_year_end)s), 0) AS Jahresbilanz
             FROM (
               SELECT month_end_date, SUM(portfolio_value) AS portfolio_value_sum
               FROM view_shareMonthlySnapshot
-              WHERE YEAR(month_end_date) = %s
+              WHERE month_end_date >= %(year_start)s AND month_end_date < %(next_year_start)s
               GROUP BY month_end_date
             ) s
-            """
-
-        params: list = []
-        year_first_day = f"{year}-01-01"
-        dec_first = f"{year}-12-01"
-
-        for month_date in month_dates:
-            params.extend([
-                month_date,
-                today,
-                "Girokonto",
-                month_date,
-                "Girokonto",
-                "Girokonto",
-                today,
-                "Girokonto",
-                today,
-                month_date,
-                "Girokonto",
-            ])
-
-        params.extend([
-            dec_first,
-            today,
-            "Girokonto",
-            dec_first,
-            "Girokonto",
-            "Girokonto",
-            today,
-            "Girokonto",
-            today,
-            year,
-            "Girokonto",
-        ])
-        params.extend(["Girokonto", "Girokonto", year_first_day])
-
-        for month_date in month_dates:
-            params.extend([
-                month_date,
-                today,
-                "Darlehen",
-                month_date,
-                "Darlehen",
-                "Darlehen",
-                today,
-                "Darlehen",
-                today,
-                month_date,
-                "Darlehen",
-            ])
-
-        params.extend([
-            dec_first,
-            today,
-            "Darlehen",
-            dec_first,
-            "Darlehen",
-            "Darlehen",
-            today,
-            "Darlehen",
-            today,
-            year,
-            "Darlehen",
-        ])
-        params.extend(["Darlehen", "Darlehen", year_first_day])
-
-        previous_year = year - 1
-        params.extend([previous_year, year])
-
-        return self._fetch_dicts(query, tuple(params))
+"""
+
+
+def _build_combined_overview_sql(materialized: bool) -> str:
+    """
+    Investments, loans and month-end assets in one statement over one flow CTE.
+    
+    Every row carries its table as source and its position inside the table
+    as seq (accounts are ordered by name); the label column is Konto resp.
+    Vermögen Ende des Monats of the individual tables.
+    """
+    asset_branches = (
+        _type_month_end_branch("Kontostand", "giro"),
+        _type_month_end_branch("Darlehen", "darlehen"),
+        _SECURITIES_MONTH_END_BRANCH,
+    )
+    assets_sql = "\n            UNION ALL".join(
+        f"""
+            SELECT 'assets_month_end', {seq}, b.* FROM ({branch}) b"""
+        for seq, branch in enumerate(asset_branches, 1)
+    )
+    return _flow_cte(materialized) + _TYPE_FLOW_CTE + f"""
+            {_account_month_end_branch()}
+            UNION ALL{assets_sql}
+            ORDER BY source, seq, label
+        """
+
+
+_COMBINED_OVERVIEW_SQL = {m: _build_combined_overview_sql(m) for m in (False, True)}
+
+# tbl_accountType ids of the single-type tables (Investment-Plattform, Darlehen)
+_INVESTMENT_ACCOUNT_TYPE = 5
+_LOAN_ACCOUNT_TYPE = 3
+
+# Tables of the combined statement and the name of their label column
+_COMBINED_LABELS = {
+    "assets_month_end": "Vermögen Ende des Monats",
+    "investments": "Konto",
+    "loans": "Konto",
+}
+
+
+# Statements of the full overview: (getter taking the year, response key);
+# a key of None marks a getter returning several tables keyed by name
+_OVERVIEW_TABLES = (
+    ("get_combined_overview", None),
+    ("get_account_balances", "account_balances"),
+    ("get_account_balances_monthly", "account_balances_monthly"),
+    ("get_securities_overview", "securities"),
+)
+
+
+def _merge_tables(results) -> dict[str, list[dict]]:
+    """Collect (response key, getter result) pairs of _OVERVIEW_TABLES into one dict of tables."""
+    tables = {}
+    for key, result in results:
+        if key is None:
+            tables.update(result)
+        else:
+            tables[key] = result
+    return tables
+
+
+class YearOverviewRepository(BaseRepository):
+    # Feature flag: read booked history from tbl_accountMonthFlow (migration 007)
+    # instead of aggregating all transactions per request
+    use_materialized_flows = True
+
+    def _fetch_dicts(
+        self,
+        query: str,
+        params: Tuple | Mapping,
+        as_columns: bool = False,
+    ) -> list[dict] | dict[str, tuple]:
+        """
+        Execute a query and return its rows as dicts.
+        
+        With as_columns=True the result is column-major instead: one tuple per
+        column name, transposed in a single zip(*rows), without a dict per row.
+        """
+        rows, description = execute_fetchall_with_retry(self.cursor, query, params, retries=1)
+        columns = [col[0] for col in description]
+        if as_columns:
+            values = zip(*rows) if rows else ((),) * len(columns)
+            return dict(zip(columns, values))
+        return [dict(zip(columns, row)) for row in rows]
+
+    def get_available_years(self) -> list[int]:
+        self.cursor.execute(_AVAILABLE_YEARS_SQL)
+        rows = self.cursor.fetchall()
+        return [row[0] for row in rows]
+
+    def get_account_balances(self, year: int) -> list[dict]:
+
+        params = {"today": date.today(), "year": year, **_month_params(year)}
+
+        return self._fetch_dicts(_ACCOUNT_BALANCES_SQL[self.use_materialized_flows], params)
+
+    def get_account_balances_monthly(self, year: int) -> list[dict]:
+
+        params = {
+            "today": date.today(),
+            "year": year,
+            **_month_params(year),
+        }
+
+        return self._fetch_dicts(_ACCOUNT_BALANCES_MONTHLY_SQL[self.use_materialized_flows], params)
+
+    def get_combined_overview(self, year: int) -> dict[str, list[dict]]:
+        """
+        Return the investments, loans and assets_month_end tables from one statement.
+        
+        All three are month-end balances over the same flows, so they share
+        one flow CTE; the rows are split by their source column afterwards.
+        """
+        params = {
+            "today": date.today(),
+            "year": year,
+            "prev_year_end": date(year - 1, 12, 31),
+            "giro": "Girokonto",
+            "darlehen": "Darlehen",
+            "investment_type": _INVESTMENT_ACCOUNT_TYPE,
+            "loan_type": _LOAN_ACCOUNT_TYPE,
+            **_month_params(year),
+        }
+
+        rows, description = execute_fetchall_with_retry(
+            self.cursor, _COMBINED_OVERVIEW_SQL[self.use_materialized_flows], params, retries=1
+        )
+        value_columns = tuple(col[0] for col in description[3:])
+        tables = {source: [] for source in _COMBINED_LABELS}
+        for source, _seq, label, *values in rows:
+            tables[source].append(dict(zip((_COMBINED_LABELS[source], *value_columns), (label, *values))))
+        return tables
+
+    def _get_single_type_month_balances(self, year: int, table: str) -> list[dict]:
+        """Month-end balances of one account type: a table of the combined overview."""
+        return self.get_combined_overview(year)[table]
+
+    def get_investments(self, year: int) -> list[dict]:
+        return self._get_single_type_month_balances(year, "investments")
+
+    def get_loans(self, year: int) -> list[dict]:
+        return self._get_single_type_month_balances(year, "loans")
+
+    def get_securities_overview(self, year: int) -> list[dict]:
+
+        params = {"year": year, "year_start": date(year, 1, 1), "next_year_start": date(year + 1, 1, 1)}
+        return self._fetch_dicts(_SECURITIES_OVERVIEW_SQL, params)
+
+    def get_assets_month_end(self, year: int) -> list[dict]:
+        return self.get_combined_overview(year)["assets_month_end"]
+
+    def get_all(self, year: int) -> dict[str, list[dict]]:
+        """
+        Return all year overview tables of a year from one repository call.
+        
+        The statements run back to back on this cursor. They are not sent as
+        one multi-statement batch: the pooled connections are opened without
+        CLIENT_MULTI_STATEMENTS and the driver's multi-result API differs
+        between the supported mysql-connector versions.
+        """
+        return _merge_tables((key, getattr(self, getter)(year)) for getter, key in _OVERVIEW_TABLES)
+
+    def get_all_concurrent(
+        self,
+        year: int,
+        connect: Callable[[], object],
+        max_workers: int = 2,
+    ) -> dict[str, list[dict]]:
+        """
+        Like get_all, but spreads the statements over extra pooled connections.
+        
+        Up to max_workers connections are taken from connect() (e.g. the
+        session pool) and each worker thread runs one table at a time on one of
+        them. With max_workers <= 0, or when connect() finds no free pooled
+        connection, nothing runs in parallel and get_all fetches the tables
+        serially on this cursor.
+        
+        Args:
+            year: Year of the overview
+            connect: Returns a new connection in autocommit mode with the
+                     session settings applied; its cursor and the connection
+                     are closed (returned to the pool) afterwards
+            max_workers: Upper bound of extra connections
+        """
+        connections = []
+        cursors = []
+        try:
+            for _ in range(min(max_workers, len(_OVERVIEW_TABLES))):
+                try:
+                    connections.append(connect())
+                except PoolError:
+                    break
+            if not connections:
+                return self.get_all(year)
+
+            workers: queue.Queue[YearOverviewRepository] = queue.Queue()
+            for connection in connections:
+                cursor = connection.cursor(buffered=True)
+                cursors.append(cursor)
+                workers.put(type(self)(cursor))
+
+            def fetch(getter: str) -> list[dict] | dict[str, list[dict]]:
+                worker = workers.get()
+                try:
+                    return getattr(worker, getter)(year)
+                finally:
+                    workers.put(worker)
+
+            with ThreadPoolExecutor(max_workers=len(connections)) as executor:
+                futures = [(key, executor.submit(fetch, getter)) for getter, key in _OVERVIEW_TABLES]
+                return _merge_tables((key, future.result()) for key, future in futures)
+        finally:
+            for cursor in cursors:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+            for connection in connections:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
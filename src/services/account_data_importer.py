@@ -7,16 +7,23 @@
 # Purpose: Module for account data importer.
 #
 import csv
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain, islice
 import logging
+import threading
+import time
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 import warnings
 
 import json
-from services.csv_utils import read_csv_rows, parse_amount, parse_date, detect_csv_encoding
-from services.field_extractor import extract_field_value
+from services.csv_utils import read_csv_lists, parse_amount, get_date_parser, detect_csv_encoding, list_import_files
+from services.field_extractor import compile_field_extractor, extract_field_value
 from infrastructure.unit_of_work import UnitOfWork
+from mysql.connector.errors import Error as MySQLError, IntegrityError
 from repositories.account_import_repository import AccountImportRepository
 from repositories.settings_repository import SettingsRepository
 
@@ -25,6 +32,38 @@ warnings.filterwarnings("ignore", message=".*duplicate.*", category=UserWarning)
 
 logger = logging.getLogger("uvicorn.error")
 
+# Project root directory (2 levels up from this file: services -> src -> root)
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Bounds for the per-file insert batch size and the flush latencies that grow or shrink it
+_MIN_BATCH_SIZE = 100
+_MAX_BATCH_SIZE = 5000
+_FAST_FLUSH_SECONDS = 0.05
+_SLOW_FLUSH_SECONDS = 0.5
+# Skipped rows logged individually per file; the rest are only counted
+_LOGGED_ROW_ERRORS = 10
+# Accounts imported at once by default; each holds one pooled connection
+_MAX_IMPORT_WORKERS = 2
+
+# Parsed import formats shared by all importer instances of this process:
+# (session_id, settings key) -> (settings version, formats), least recently used first
+_IMPORT_FORMAT_CACHE_SIZE = 100
+_import_format_cache: OrderedDict[tuple[str, str], tuple[Any, dict]] = OrderedDict()
+_import_format_cache_lock = threading.Lock()
+
+
+def invalidate_import_format_cache() -> int:
+   """
+   Drop all cached import formats after a format was added, changed or deleted.
+
+   Returns:
+      Number of dropped entries
+   """
+   with _import_format_cache_lock:
+      dropped = len(_import_format_cache)
+      _import_format_cache.clear()
+   return dropped
+
 
 @dataclass
 class ImportJob:
@@ -47,13 +86,23 @@ class AccountDataImporter:
       self.pool_manager = pool_manager
       self.session_id = session_id
       self._settings_key = "import_format"
+      self._formats_cache: dict | None = None
+      # Encodings found by version detection, keyed (file, preferred encoding),
+      # so the import itself does not sniff the file again
+      self._resolved_encodings: dict[tuple[Path, str], str] = {}
 
    def _load_all_formats(self) -> dict:
       """Load import formats from database settings table.
       
-      Formats are always loaded fresh to ensure consistency with database state.
+      Formats are loaded once per importer and reused for every file. Parsed
+      formats are also shared between importer instances of a session through
+      _import_format_cache, validated against a cheap version probe of the
+      settings rows; the settings endpoints also drop that cache whenever a
+      format is written. The loaded dicts are only read.
       """
-      return self._load_formats_from_settings()
+      if self._formats_cache is None:
+         self._formats_cache = self._load_formats_from_settings()
+      return self._formats_cache
 
    def _load_formats_from_settings(self) -> dict:
       connection = None
@@ -62,6 +111,15 @@ class AccountDataImporter:
          connection = self.pool_manager.get_connection(self.session_id)
          cursor = connection.cursor(buffered=True)
          repo = SettingsRepository(cursor)
+         cache_key = (self.session_id, self._settings_key)
+         version = repo.get_settings_version(self._settings_key)
+         with _import_format_cache_lock:
+            cached = _import_format_cache.get(cache_key)
+            if cached is not None:
+               _import_format_cache.move_to_end(cache_key)
+         if cached is not None and cached[0] == version:
+            return cached[1]
+
          entries = repo.get_setting_entries(self._settings_key)
          formats: dict = {}
          for entry in entries:
@@ -72,9 +130,14 @@ class AccountDataImporter:
                if name and isinstance(config, dict):
                   # Repair malformed configs (strings instead of objects)
                   config = self._repair_config(config)
-                  formats[name] = config
+                  formats[name] = self._normalize_format(config)
             except Exception:
                continue
+         with _import_format_cache_lock:
+            _import_format_cache[cache_key] = (version, formats)
+            _import_format_cache.move_to_end(cache_key)
+            while len(_import_format_cache) > _IMPORT_FORMAT_CACHE_SIZE:
+               _import_format_cache.popitem(last=False)
          return formats
       finally:
          if cursor:
@@ -108,10 +171,11 @@ class AccountDataImporter:
       if "columns" in config and isinstance(config["columns"], dict):
          for col_name, col_config in config["columns"].items():
             if isinstance(col_config, dict):
-               # Repair sources array
-               if "sources" in col_config and isinstance(col_config["sources"], list):
+               # Repair sources array (only rebuilt if it holds string items)
+               sources = col_config.get("sources")
+               if isinstance(sources, list) and any(isinstance(item, str) for item in sources):
                   repaired_sources = []
-                  for item in col_config["sources"]:
+                  for item in sources:
                      if isinstance(item, str):
                         # Try to parse string as key:value pairs
                         try:
@@ -136,6 +200,30 @@ class AccountDataImporter:
       
       return config
 
+   def _normalize_format(self, config: dict) -> dict:
+      """Split a format config into its versions once, when the formats are loaded.
+      
+      Returns:
+         dict with keys:
+            config: the (repaired) format config as stored
+            legacy: True if the format has no nested versions (config is the mapping)
+            versions: version key -> config for every nested version, in config order
+            detectable: subset of versions with a header, used for header matching
+            default: configured default version key or None
+      """
+      versions = {
+         key: value for key, value in config.items()
+         if key != 'default' and isinstance(value, dict)
+      }
+      return {
+         "config": config,
+         # A format is versioned once any nested version carries its own encoding
+         "legacy": not any('encoding' in value for value in versions.values()),
+         "versions": versions,
+         "detectable": {key: value for key, value in versions.items() if 'header' in value},
+         "default": config.get('default', None),
+      }
+
    def _get_mapping(self, format_name: str, csv_path: Path = None) -> tuple[dict, str]:
       """Get format mapping, optionally with automatic version detection.
       
@@ -152,13 +240,10 @@ class AccountDataImporter:
             f"Format '{format_name}' not found in settings. Available: {list(formats.keys())}"
          )
       
-      format_config = formats[format_name]
-      
-      # Check if format has nested versions
-      has_versions = any(k not in ['default'] and isinstance(v, dict) and 'encoding' in v 
-                        for k, v in format_config.items())
+      format_spec = formats[format_name]
+      format_config = format_spec["config"]
       
-      if not has_versions:
+      if format_spec["legacy"]:
          # Legacy format without versions - return as-is
          return format_config, "legacy"
       
@@ -168,13 +253,13 @@ class AccountDataImporter:
       
       if csv_path and csv_path.exists():
          # Try automatic header detection
-         detected_version = self._detect_format_version(format_name, format_config, csv_path)
+         detected_version = self._detect_format_version(format_name, format_spec["detectable"], csv_path)
          if detected_version:
             detection_method = "header-match"
       
       # Fallback to default version
       if not detected_version:
-         detected_version = format_config.get('default', None)
+         detected_version = format_spec["default"]
          if detected_version:
             detection_method = "default"
             if csv_path:
@@ -184,9 +269,9 @@ class AccountDataImporter:
       
       # Fallback to first available version
       if not detected_version:
-         versions = [k for k in format_config.keys() if k != 'default' and isinstance(format_config[k], dict)]
+         versions = format_spec["versions"]
          if versions:
-            detected_version = versions[0]
+            detected_version = next(iter(versions))
             detection_method = "first-available"
             logger.warning(
                f"No default for '{format_name}', using first available version '{detected_version}'"
@@ -224,7 +309,7 @@ class AccountDataImporter:
       
       return version_config, f"{detected_version} ({detection_method})"
 
-   def _detect_format_version(self, format_name: str, format_config: dict, csv_path: Path) -> str | None:
+   def _detect_format_version(self, format_name: str, versions: dict, csv_path: Path) -> str | None:
       """Detect best matching format version based on CSV header columns.
       
       Uses flexible matching: all expected columns must be present in CSV header,
@@ -234,20 +319,21 @@ class AccountDataImporter:
       
       Args:
          format_name: Format name for logging
-         format_config: Format configuration with versions
+         versions: Format versions that define a header (version key -> config)
          csv_path: Path to CSV file
       
       Returns:
          Version key of best match, or None if no match found
       """
-      versions = {k: v for k, v in format_config.items() 
-                 if k != 'default' and isinstance(v, dict) and 'header' in v}
-      
       if not versions:
          return None
       
       best_match = None
       best_score = 0
+      # Versions often share encoding/delimiter/header_skip: detect each
+      # encoding and read each distinct header only once per file
+      encodings: dict[str, str | None] = {}
+      header_sets: dict[tuple[str, int, str], set[str] | None] = {}
       
       # Try each version with its specific encoding/delimiter
       for version_key, version_config in versions.items():
@@ -261,22 +347,33 @@ class AccountDataImporter:
             header_skip = version_config.get('header_skip', 0)
             
             # Detect actual encoding (with fallback like csv_utils does)
-            try:
-               actual_encoding = detect_csv_encoding(csv_path, preferred_encoding)
-            except RuntimeError as enc_error:
-               logger.debug(f"Version '{version_key}': Encoding detection failed - {enc_error}")
+            if preferred_encoding not in encodings:
+               try:
+                  encodings[preferred_encoding] = detect_csv_encoding(csv_path, preferred_encoding)
+                  self._resolved_encodings[(csv_path, preferred_encoding)] = encodings[preferred_encoding]
+               except RuntimeError as enc_error:
+                  logger.debug(f"Version '{version_key}': Encoding detection failed - {enc_error}")
+                  encodings[preferred_encoding] = None
+            actual_encoding = encodings[preferred_encoding]
+            if actual_encoding is None:
                continue
             
-            # Read CSV header with detected encoding
-            with open(csv_path, 'r', encoding=actual_encoding) as f:
-               # Skip header lines if configured
-               for _ in range(header_skip):
-                  f.readline()
-               
-               # Read header row
-               reader = csv.reader(f, delimiter=delimiter)
-               csv_header = next(reader)
-               csv_header_set = set(h.strip() for h in csv_header)
+            header_key = (actual_encoding, header_skip, delimiter)
+            if header_key not in header_sets:
+               header_sets[header_key] = None
+               # Read CSV header with detected encoding
+               with open(csv_path, 'r', encoding=actual_encoding, newline='') as f:
+                  # Skip header lines if configured
+                  for _ in range(header_skip):
+                     f.readline()
+                  
+                  # Read header row
+                  reader = csv.reader(f, delimiter=delimiter)
+                  csv_header = next(reader)
+                  header_sets[header_key] = set(h.strip() for h in csv_header)
+            csv_header_set = header_sets[header_key]
+            if csv_header_set is None:
+               continue
             
             expected_set = set(expected_headers)
             
@@ -312,6 +409,31 @@ class AccountDataImporter:
       """
       return extract_field_value(row, mapping)
 
+   def _debug_first_rows(self, rows, columns: dict, fieldnames: list[str], extract_date, count: int = 3):
+      """Log the dateValue mapping and raw values of the first rows; returns an iterator over all rows."""
+      head = list(islice(rows, count))
+      date_mapping = columns.get('dateValue')
+      csv_keys = fieldnames[:5]
+      logger.debug("dateValue mapping=%s, csv_keys=%s", date_mapping, csv_keys)
+      for row_number, row in enumerate(head, start=1):
+         try:
+            date_value_raw = extract_date(row)
+         except Exception as exc:
+            date_value_raw = f"<{exc}>"
+         logger.debug("Row %s: raw dateValue='%s'", row_number, date_value_raw)
+      return chain(head, rows)
+
+   def _compile_extractors(self, columns: dict, fieldnames: list[str]) -> dict[str, Any]:
+      """Resolve the mapping of every imported field to column indexes once per file.
+      
+      Returns:
+         Dictionary mapping field name to a callable(row list) -> str
+      """
+      return {
+         field_name: compile_field_extractor(columns.get(field_name), fieldnames)
+         for field_name in ("dateValue", "amount", "description", "iban", "bic", "recipientApplicant")
+      }
+
    def _validate_csv_headers(self, csv_fieldnames: list[str], columns: dict, csv_filename: str) -> bool:
       """Validate that all required columns are present in CSV file.
       
@@ -326,7 +448,7 @@ class AccountDataImporter:
       Returns:
          True if all required columns found, False if validation failed
       """
-      csv_fieldnames_lower = [f.lower() for f in csv_fieldnames]
+      csv_set = frozenset(csv_fieldnames)
       missing_fields = []
       
       for field_name, field_config in columns.items():
@@ -339,38 +461,30 @@ class AccountDataImporter:
          
          if isinstance(field_config, str):
             # Simple string mapping
-            field_found = field_config in csv_fieldnames
+            field_found = field_config in csv_set
          elif isinstance(field_config, dict):
             # Single column name (new syntax)
             if "name" in field_config:
                name = field_config.get("name")
-               field_found = name in csv_fieldnames
+               field_found = name in csv_set
             # Legacy: Multiple names
             elif "names" in field_config:
                # Check if any of the alternative names exist
-               for name in field_config.get("names", []):
-                  if name in csv_fieldnames:
-                     field_found = True
-                     break
+               field_found = not csv_set.isdisjoint(field_config.get("names", []))
             # Regex extraction - source column(s) must exist
             elif "sources" in field_config:
                sources = field_config.get("sources", [])
-               for source_config in sources:
-                  if isinstance(source_config, dict):
-                     source_name = source_config.get("name")
-                     if source_name and source_name in csv_fieldnames:
-                        field_found = True
-                        break
+               field_found = any(
+                  source_config.get("name") in csv_set
+                  for source_config in sources
+                  if isinstance(source_config, dict)
+               )
             # Legacy regex extraction
             elif "regex" in field_config:
-               source = field_config.get("source")
-               if source and source in csv_fieldnames:
-                  field_found = True
+               field_found = field_config.get("source") in csv_set
             # Join columns - check if source columns exist
             elif "join" in field_config:
-               join_fields = field_config.get("join", [])
-               if any(f in csv_fieldnames for f in join_fields):
-                  field_found = True
+               field_found = not csv_set.isdisjoint(field_config.get("join", []))
          
          if not field_found:
             missing_fields.append(field_name)
@@ -415,7 +529,8 @@ class AccountDataImporter:
       """
       Import a single CSV file for an account job.
       
-      Each row is committed immediately to ensure insert_ignore() duplicate detection works correctly.
+      All rows go through a single UnitOfWork on one pooled connection; rows are
+      inserted and committed once per batch (INSERT IGNORE drops duplicates).
       Accounting entries are automatically created by database trigger (trg_transaction_create_accounting_entry).
       
       Args:
@@ -449,83 +564,156 @@ class AccountDataImporter:
             batch_size = int(batch_size)
          except Exception:
             batch_size = 1000
-         batch_size = max(100, min(batch_size, 5000))
+         batch_size = max(_MIN_BATCH_SIZE, min(batch_size, _MAX_BATCH_SIZE))
 
+         # Raw rows (row number, iban, bic, description, amount, date, recipient);
+         # dates and amounts are parsed per batch right before the insert
          batch_rows: list[tuple] = []
+         # Bound once for the row loop; flush_batch clears the list in place, so it stays valid
+         batch_rows_append = batch_rows.append
+         # Bank exports repeat the same booking day many times: parse each date string once per file
+         date_cache: dict[str, datetime] = {}
+         parse_date_value = get_date_parser(date_format)
+
+         skipped_rows = 0
+
+         def skip_row(row_number: int, exc: Exception) -> None:
+            nonlocal skipped_rows
+            skipped_rows += 1
+            if skipped_rows <= _LOGGED_ROW_ERRORS:
+               logger.warning("Skipping row %s in %s: %s", row_number, csv_path.name, exc)
+
+         def parse_batch() -> list[tuple]:
+            parsed = []
+            append = parsed.append
+            cached_date = date_cache.get
+            account_id = job.account_id
+            for row_number, iban, bic, description, amount_raw, date_raw, recipient in batch_rows:
+               try:
+                  date_value = cached_date(date_raw)
+                  if date_value is None:
+                     date_value = date_cache[date_raw] = parse_date_value(date_raw)
+                  amount = parse_amount(amount_raw, decimal_sep)
+               except Exception as exc:
+                  skip_row(row_number, exc)
+                  continue
+               append((iban, bic, description, amount, date_value, recipient, account_id))
+            return parsed
 
          def flush_batch() -> None:
-            nonlocal inserted
+            nonlocal inserted, batch_size
             if not batch_rows:
                return
-            with UnitOfWork(connection) as uow:
-               tx_repo = TransactionRepository(uow)
-               inserted += tx_repo.insert_ignore_many(batch_rows)
+            rows_to_insert = parse_batch()
             batch_rows.clear()
-
-         # Validate CSV headers before processing
-         # Peek at first row to get fieldnames for validation
-         first_pass = True
-         for row in read_csv_rows(csv_path, delimiter=delimiter, encoding=encoding, header_skip=header_skip):
-            if first_pass:
-               # Get fieldnames from first iteration
-               # (read_csv_rows already normalized them)
-               fieldnames = list(row.keys())
-               
-               # Validate headers
-               if not self._validate_csv_headers(fieldnames, columns, csv_path.name):
-                  return 0, 0  # Validation failed, abort import
-               
-               logger.info("CSV columns validated: %s", csv_path.name)
-               first_pass = False
-            
-            total += 1
+            if not rows_to_insert:
+               return
+            started = time.perf_counter()
             try:
-               # Get field values (headers already validated)
-               date_value_raw = self._get_field(row, columns.get("dateValue"), "dateValue")
-               
-               # Debug logging for first few rows
-               if total <= 3 and logger.isEnabledFor(logging.DEBUG):
-                  logger.debug(
-                     f"Row {total}: dateValue mapping={columns.get('dateValue')}, "
-                     f"raw_value='{date_value_raw}', csv_keys={list(row.keys())[:5]}"
-                  )
-               
-               amount_raw = self._get_field(row, columns.get("amount"), "amount")
-               description = self._get_field(row, columns.get("description"), "description")
-               iban = self._get_field(row, columns.get("iban"), "iban")
-               bic = self._get_field(row, columns.get("bic"), "bic")
-               recipient = self._get_field(row, columns.get("recipientApplicant"), "recipientApplicant")
-
-               # Parse values using centralized utilities
-               date_value = parse_date(date_value_raw, date_format)
-               amount = parse_amount(amount_raw, decimal_sep)
-
-               # Batch insert rows for better performance
-               batch_rows.append(
+               # One multi-row statement per batch (batches are capped at _MAX_BATCH_SIZE rows)
+               inserted += tx_repo.insert_ignore_many_dedup(rows_to_insert, job.account_id, chunk_size=_MAX_BATCH_SIZE)
+            except IntegrityError as exc:
+               # INSERT IGNORE downgrades duplicates to warnings; should a constraint
+               # still reject the batch, retry its rows one by one and skip the offenders
+               uow.rollback()
+               logger.warning("Batch insert failed in %s, retrying row by row: %s", csv_path.name, exc)
+               for row in rows_to_insert:
+                  try:
+                     inserted += tx_repo.insert_ignore_many_chunked([row])
+                  except IntegrityError as row_exc:
+                     logger.warning("Skipping row in %s: %s", csv_path.name, row_exc)
+            except Exception:
+               uow.rollback()
+               raise
+            uow.commit()
+            # Adapt the batch size to the observed round trip: grow while the
+            # database keeps up, shrink when a flush starts to stall
+            elapsed = time.perf_counter() - started
+            if elapsed < _FAST_FLUSH_SECONDS:
+               batch_size = min(batch_size * 2, _MAX_BATCH_SIZE)
+            elif elapsed > _SLOW_FLUSH_SECONDS:
+               batch_size = max(batch_size // 2, _MIN_BATCH_SIZE)
+
+         # One unit of work (and repository) for the whole file, committed per batch
+         with UnitOfWork(connection) as uow:
+            tx_repo = TransactionRepository(uow)
+
+            # Validate CSV headers before processing
+            # (read_csv_lists yields the normalized header first)
+            resolved_encoding = self._resolved_encodings.get((csv_path, encoding))
+            rows = read_csv_lists(
+               csv_path,
+               delimiter=delimiter,
+               encoding=resolved_encoding or encoding,
+               header_skip=header_skip,
+               detect_encoding=resolved_encoding is None,
+            )
+            fieldnames = next(rows)
+            if not self._validate_csv_headers(fieldnames, columns, csv_path.name):
+               rows.close()
+               return 0, 0  # Validation failed, abort import
+         
+            logger.info("CSV columns validated: %s", csv_path.name)
+            extractors = self._compile_extractors(columns, fieldnames)
+            extract_date = extractors["dateValue"]
+            extract_amount = extractors["amount"]
+            extract_description = extractors["description"]
+            extract_iban = extractors["iban"]
+            extract_bic = extractors["bic"]
+            extract_recipient = extractors["recipientApplicant"]
+
+            # Debug logging for first few rows, kept out of the row loop
+            if logger.isEnabledFor(logging.DEBUG):
+               rows = self._debug_first_rows(rows, columns, fieldnames, extract_date)
+
+            # IBAN, BIC and recipient repeat across most rows of a statement:
+            # share one string object per distinct value within the file
+            intern_value = {}.setdefault
+
+            for row in rows:
+               total += 1
+               try:
+                  # Get field values (headers already validated)
+                  date_value_raw = extract_date(row)
+                  amount_raw = extract_amount(row)
+                  description = extract_description(row)
+                  iban = extract_iban(row)
+                  iban = intern_value(iban, iban)
+                  bic = extract_bic(row)
+                  bic = intern_value(bic, bic)
+                  recipient = extract_recipient(row)
+                  recipient = intern_value(recipient, recipient)
+               except (ValueError, KeyError, IndexError, TypeError) as exc:
+                  # Keep importing; date/amount parse errors are reported per batch
+                  skip_row(total, exc)
+                  continue
+
+               # Batch insert rows for better performance; duplicates are
+               # ignored by the database and handled per batch in flush_batch
+               batch_rows_append(
                   (
+                     total,
                      iban,
                      bic,
                      description,
-                     amount,
-                     date_value,
+                     amount_raw,
+                     date_value_raw,
                      recipient,
-                     job.account_id,
                   )
                )
                if len(batch_rows) >= batch_size:
                   flush_batch()
-            except Exception as exc:  # keep importing but report only relevant errors
-               # Silently skip duplicate entries - they are expected and normal
-               error_msg = str(exc).lower()
-               if "duplicate" in error_msg or "unique" in error_msg:
-                  # This is expected when importing duplicate data - don't print
-                  pass
-               else:
-                  # Only print unexpected errors
-                  logger.warning("Skipping row %s in %s: %s", total, csv_path.name, exc)
       
-         # Flush remaining rows
-         flush_batch()
+            # Flush remaining rows
+            flush_batch()
+
+         if skipped_rows > _LOGGED_ROW_ERRORS:
+            logger.warning(
+               "Skipped %s rows in %s (only the first %s are logged)",
+               skipped_rows,
+               csv_path.name,
+               _LOGGED_ROW_ERRORS,
+            )
 
       except ValueError as e:
          # CSV has no header or is empty
@@ -571,19 +759,20 @@ class AccountDataImporter:
                pass
       
       jobs = []
-      
-      # Get project root directory (2 levels up from this file: services -> src -> root)
-      project_root = Path(__file__).resolve().parents[2]
+      # Several accounts often share an import folder: resolve each path string once
+      resolved_paths: dict[str, Path] = {}
       
       for row in rows:
          path_str = row["path"]
-         path = Path(path_str)
-         
-         # If path is relative, resolve it from project root
-         if not path.is_absolute():
-            path = (project_root / path).resolve()
-         else:
-            path = path.resolve()
+         path = resolved_paths.get(path_str)
+         if path is None:
+            path = Path(path_str)
+            # If path is relative, resolve it from project root
+            if not path.is_absolute():
+               path = (_PROJECT_ROOT / path).resolve()
+            else:
+               path = path.resolve()
+            resolved_paths[path_str] = path
          
          jobs.append(
             ImportJob(
@@ -596,29 +785,70 @@ class AccountDataImporter:
          )
       return jobs
 
-   def import_account_data(self) -> bool:
+   def _import_account_files(self, tasks: list[tuple[Path, dict, ImportJob]]) -> tuple[int, int]:
+      """Import the files of one account in order; a database error skips only the failing file.
+      
+      Returns:
+         Tuple of (inserted_count, total_rows) over all imported files
+      """
+      inserted_sum = 0
+      total_sum = 0
+      for csv_file, mapping, job in tasks:
+         try:
+            inserted, total = self._import_file(csv_file, mapping, job)
+         except MySQLError as exc:
+            logger.warning(
+               "Import of %s for account '%s' failed: %s",
+               csv_file.name,
+               job.account_name,
+               exc,
+            )
+            continue
+         inserted_sum += inserted
+         total_sum += total
+         logger.info(
+            "Imported %s/%s rows from %s for account '%s'",
+            inserted,
+            total,
+            csv_file.name,
+            job.account_name,
+         )
+      return inserted_sum, total_sum
+
+   def import_account_data(self, max_workers: int | None = None) -> bool:
       """
       Imports account data from configured import paths.
       Uses the connection pool manager for database access.
+      
+      Accounts are imported concurrently, each on its own pooled connection;
+      the files of one account run serially so their INSERT IGNOREs never
+      contend for the same unique keys. A database error fails only its file.
+      
+      Args:
+         max_workers: Number of accounts imported at once; defaults to
+                      _MAX_IMPORT_WORKERS, bounded so that one pool connection
+                      besides the calling request's stays free
       """
       logger.info("%s", "=" * 100)
       logger.info("FiniA Account CSV Import")
       logger.info("%s", "=" * 100)
 
+      self._formats_cache = None
+      self._resolved_encodings.clear()
       jobs = self._collect_jobs()
       if not jobs:
          logger.info("No account import paths configured. Add entries to tbl_accountImportPath first.")
          return True
 
-      overall_inserted = 0
-      overall_total = 0
-
+      # Resolve formats serially: this fills the formats cache before any worker
+      # runs, so the workers only read shared state
+      tasks_by_account: dict[int, list[tuple[Path, dict, ImportJob]]] = {}
       for job in jobs:
          if not job.path.exists():
             logger.warning("Skipping account '%s': folder not found %s", job.account_name, job.path)
             continue
 
-         files = sorted(job.path.glob(f"*.{job.file_ending}"))
+         files = list_import_files(job.path, job.file_ending)
          if not files:
             logger.warning(
                "No *.%s files found in %s for account '%s'",
@@ -643,17 +873,26 @@ class AccountDataImporter:
                logger.error(f"Error loading format for {csv_file.name}: {exc}")
                logger.error("Failed to load format for %s: %s", csv_file.name, exc)
                continue
-            
-            inserted, total = self._import_file(csv_file, mapping, job)
-            overall_inserted += inserted
-            overall_total += total
-            logger.info(
-               "Imported %s/%s rows from %s for account '%s'",
-               inserted,
-               total,
-               csv_file.name,
-               job.account_name,
-            )
+            tasks_by_account.setdefault(job.account_id, []).append((csv_file, mapping, job))
+
+      overall_inserted = 0
+      overall_total = 0
+
+      if tasks_by_account:
+         if max_workers is None:
+            pool_size = getattr(self.pool_manager, "pool_size", 2)
+            max_workers = min(_MAX_IMPORT_WORKERS, pool_size - 2)
+         max_workers = max(1, min(max_workers, len(tasks_by_account)))
+
+         with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="account-import") as executor:
+            futures = [
+               executor.submit(self._import_account_files, tasks)
+               for tasks in tasks_by_account.values()
+            ]
+            for future in as_completed(futures):
+               inserted, total = future.result()
+               overall_inserted += inserted
+               overall_total += total
 
       logger.info("%s", "=" * 100)
       logger.info("Finished CSV import. Inserted %s of %s rows", overall_inserted, overall_total)
@@ -20,11 +20,22 @@ Features:
 import json
 import logging
 import re
-from typing import Optional, Dict, List
+from functools import lru_cache
+from typing import Callable, Optional, Dict, List
 
 
 logger = logging.getLogger("uvicorn.error")
 
+
+@lru_cache(maxsize=1024)
+def _compile_rule_regex(pattern: str, flags: int) -> Optional[re.Pattern]:
+    """Compile a rule regex once; returns None for invalid patterns."""
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return None
+
+
 def _evaluate_string_rule(tx_value: str, rule_value: str, rule_type: str, case_sensitive: bool) -> bool:
     """Evaluate string-based rules"""
     if rule_type == "contains":
@@ -40,22 +51,123 @@ def _evaluate_string_rule(tx_value: str, rule_value: str, rule_type: str, case_s
         return tx_value.endswith(rule_value) if rule_value else False
     
     elif rule_type == "regex":
-        try:
-            flags = 0 if case_sensitive else re.IGNORECASE
-            return bool(re.search(rule_value, tx_value, flags))
-        except re.error:
-            return False
+        compiled = _compile_rule_regex(rule_value, 0 if case_sensitive else re.IGNORECASE)
+        return bool(compiled.search(tx_value)) if compiled else False
     
     return False
 
 
+_LOGIC_TOKEN_PATTERN = re.compile(r'\s*(?:(\d+)|(\()|(\))|([A-Za-z]+))')
+_LOGIC_OPERATORS = {
+    'AND': 'AND', 'UND': 'AND',
+    'OR': 'OR', 'ODER': 'OR',
+    'NOT': 'NOT', 'NICHT': 'NOT',
+}
+
+
+def _tokenize_logic(logic_str: str) -> List[str]:
+    """Split a condition logic expression into ids, parentheses and operators."""
+    tokens = []
+    pos = 0
+    end = len(logic_str.rstrip())
+    while pos < end:
+        match = _LOGIC_TOKEN_PATTERN.match(logic_str, pos)
+        if not match:
+            raise ValueError(f"Unexpected character at position {pos}")
+        number, lparen, rparen, word = match.groups()
+        if word is not None:
+            operator = _LOGIC_OPERATORS.get(word.upper())
+            if operator is None:
+                raise ValueError(f"Unknown operator '{word}'")
+            tokens.append(operator)
+        else:
+            tokens.append(number or lparen or rparen)
+        pos = match.end()
+    return tokens
+
+
+@lru_cache(maxsize=4096)
+def compile_logic(logic_str: str) -> Callable[[Dict[int, bool]], bool]:
+    """
+    Compile a condition logic expression into a reusable predicate.
+    
+    Grammar (precedence as in Python): NOT > AND > OR, parentheses for
+    grouping, integers for condition IDs. Predicates are cached per
+    expression, so rules are only parsed once.
+    
+    Args:
+        logic_str: Expression like "(1 OR 3) AND 2" or "(1 ODER 3) UND 2"
+        
+    Returns:
+        Callable taking the condition results dict and returning a bool
+        
+    Raises:
+        ValueError: If the expression is malformed
+    """
+    tokens = _tokenize_logic(logic_str)
+    pos = 0
+
+    def peek() -> Optional[str]:
+        return tokens[pos] if pos < len(tokens) else None
+
+    def parse_or():
+        nonlocal pos
+        operands = [parse_and()]
+        while peek() == 'OR':
+            pos += 1
+            operands.append(parse_and())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda results: any(operand(results) for operand in operands)
+
+    def parse_and():
+        nonlocal pos
+        operands = [parse_not()]
+        while peek() == 'AND':
+            pos += 1
+            operands.append(parse_not())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda results: all(operand(results) for operand in operands)
+
+    def parse_not():
+        nonlocal pos
+        if peek() == 'NOT':
+            pos += 1
+            operand = parse_not()
+            return lambda results: not operand(results)
+        return parse_atom()
+
+    def parse_atom():
+        nonlocal pos
+        token = peek()
+        if token == '(':
+            pos += 1
+            inner = parse_or()
+            if peek() != ')':
+                raise ValueError("Missing closing parenthesis")
+            pos += 1
+            return inner
+        if token is not None and token.isdigit():
+            pos += 1
+            cond_id = int(token)
+            # Unknown IDs keep the former eval() semantics: the bare integer
+            return lambda results: bool(results.get(cond_id, cond_id))
+        raise ValueError(f"Unexpected token {token!r}")
+
+    predicate = parse_or()
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected token {tokens[pos]!r}")
+    return predicate
+
+
 def parse_condition_logic(logic_str: str, condition_results: Dict[int, bool]) -> bool:
     """
     Parse and evaluate condition logic expression.
     
     Supports:
-    - AND, OR operators (English)
-    - UND, ODER operators (German)
+    - AND, OR, NOT operators (English)
+    - UND, ODER, NICHT operators (German)
     - Parentheses for grouping
     - Condition IDs (integers)
     
@@ -79,30 +191,7 @@ def parse_condition_logic(logic_str: str, condition_results: Dict[int, bool]) ->
         return any(condition_results.values())
     
     try:
-        # Normalize: German -> English
-        normalized = logic_str.upper()
-        normalized = normalized.replace(' UND ', ' AND ')
-        normalized = normalized.replace(' ODER ', ' OR ')
-        normalized = normalized.replace(' NICHT ', ' NOT ')
-        
-        # Replace condition IDs with their boolean results
-        for cond_id, result in condition_results.items():
-            # Use word boundaries to avoid partial replacements (e.g., 1 in 10)
-            # Replace with capitalized True/False for Python eval
-            normalized = re.sub(
-                rf'\b{cond_id}\b',
-                str(result),  # Python's str(True) = "True", str(False) = "False"
-                normalized
-            )
-        
-        # Evaluate as Python expression
-        # After replacement we have: "(True OR False) AND True"
-        # Convert operators to Python syntax
-        normalized = normalized.replace(' AND ', ' and ')
-        normalized = normalized.replace(' OR ', ' or ')
-        normalized = normalized.replace(' NOT ', ' not ')
-        
-        return eval(normalized)
+        return compile_logic(logic_str)(condition_results)
         
     except Exception as e:
         # Fallback on error: OR all conditions
@@ -110,13 +199,19 @@ def parse_condition_logic(logic_str: str, condition_results: Dict[int, bool]) ->
         return any(condition_results.values())
 
 
-def evaluate_condition(transaction_data: Dict, condition: Dict) -> bool:
+def evaluate_condition(
+    transaction_data: Dict,
+    condition: Dict,
+    lowered: Optional[Dict[str, str]] = None
+) -> bool:
     """
     Evaluate a single condition against transaction data.
     
     Args:
         transaction_data: Transaction dict with keys: description, recipientApplicant, amount, iban
         condition: Single condition dict with keys: id, type, columnName, value, caseSensitive, minAmount, maxAmount
+        lowered: Optional per-transaction cache of lowercased column values,
+            shared across all rules tested against the same transaction
         
     Returns:
         True if condition matches, False otherwise
@@ -150,19 +245,30 @@ def evaluate_condition(transaction_data: Dict, condition: Dict) -> bool:
     case_sensitive = condition.get('caseSensitive', False)
     
     if not case_sensitive:
-        tx_str = tx_str.lower()
-        rule_value = rule_value.lower() if rule_value else ''
+        if lowered is None:
+            tx_str = tx_str.lower()
+        else:
+            tx_lower = lowered.get(column_name)
+            if tx_lower is None:
+                tx_lower = lowered[column_name] = tx_str.lower()
+            tx_str = tx_lower
+        rule_value = condition.get('_valueLower') or (rule_value.lower() if rule_value else '')
     
     return _evaluate_string_rule(tx_str, rule_value, cond_type, case_sensitive)
 
 
-def evaluate_rule(transaction_data: Dict, rule: Dict) -> bool:
+def evaluate_rule(
+    transaction_data: Dict,
+    rule: Dict,
+    lowered: Optional[Dict[str, str]] = None
+) -> bool:
     """
     Evaluate if a transaction matches an automation rule.
     
     Args:
         transaction_data: Transaction dict with keys: description, recipientApplicant, amount, iban
         rule: Rule dict with conditions and conditionLogic
+        lowered: Optional per-transaction cache of lowercased column values
         
     Returns:
         True if rule matches, False otherwise
@@ -171,20 +277,24 @@ def evaluate_rule(transaction_data: Dict, rule: Dict) -> bool:
     if not conditions:
         return False
     
+    logic_str = rule.get('conditionLogic')
+    if not logic_str:
+        # Default: OR all conditions, stopping at the first match
+        return any(
+            evaluate_condition(transaction_data, condition, lowered)
+            for condition in conditions
+            if condition.get('id') is not None
+        )
+    
     # Evaluate each condition
     condition_results = {}
     for condition in conditions:
         cond_id = condition.get('id')
         if cond_id is not None:
-            condition_results[cond_id] = evaluate_condition(transaction_data, condition)
+            condition_results[cond_id] = evaluate_condition(transaction_data, condition, lowered)
     
     # Apply condition logic
-    logic_str = rule.get('conditionLogic')
-    if logic_str:
-        return parse_condition_logic(logic_str, condition_results)
-    else:
-        # Default: OR all conditions
-        return any(condition_results.values())
+    return parse_condition_logic(logic_str, condition_results)
 
 
 def load_rules(cursor, account_id: Optional[int] = None) -> List[Dict]:
@@ -224,6 +334,12 @@ def load_rules(cursor, account_id: Optional[int] = None) -> List[Dict]:
                     if rule_accounts and account_id not in rule_accounts:
                         continue
                 
+                # Lowercase case-insensitive values once instead of per transaction
+                for condition in rule.get('conditions') or []:
+                    value = condition.get('value')
+                    if value and not condition.get('caseSensitive', False):
+                        condition['_valueLower'] = value.lower()
+                
                 rules.append(rule)
                 
             except (json.JSONDecodeError, TypeError) as e:
@@ -260,8 +376,10 @@ def apply_rules_to_transaction(
     Returns:
         Category ID if a rule matches, None otherwise
     """
+    # Lowercased column values, filled on demand and shared by all rules
+    lowered = {}
     for rule in rules:
-        if evaluate_rule(transaction_data, rule):
+        if evaluate_rule(transaction_data, rule, lowered):
             return rule.get('category')
     
     return None
@@ -13,12 +13,41 @@ Central helpers for CSV processing during transaction imports.
 Avoids code duplication across import implementations.
 """
 
+import codecs
 import csv
-import re
+import os
 from pathlib import Path
 from decimal import Decimal
 from datetime import datetime
-from typing import Iterator
+from functools import lru_cache
+from typing import Callable, Iterator
+
+# Read buffer for full-file CSV reads: bank exports are read front to back once,
+# so a large buffer trades a little memory for far fewer read calls
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+
+def list_import_files(folder: Path, file_ending: str) -> list[Path]:
+    """
+    Lists the files of an import folder with the given file ending, sorted by name.
+    
+    Uses a single os.scandir pass, so only matching entries become Path objects.
+    
+    Args:
+        folder: Import folder
+        file_ending: File ending without dot (e.g. "csv")
+    
+    Returns:
+        Matching files, sorted by name
+    """
+    suffix = f".{file_ending}"
+    with os.scandir(folder) as entries:
+        names = [
+            entry.name for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+    names.sort()
+    return [folder / name for name in names]
 
 
 def detect_csv_encoding(csv_path: Path, preferred_encoding: str = "utf-8") -> str:
@@ -40,13 +69,22 @@ def detect_csv_encoding(csv_path: Path, preferred_encoding: str = "utf-8") -> st
         # Common fallback encodings for German bank exports
         encodings_to_try.extend(["latin-1", "iso-8859-1", "cp1252"])
     
+    try:
+        # Read the first chunk once and probe every candidate in memory
+        with open(csv_path, "rb") as probe_handle:
+            sample = probe_handle.read(4096)
+    except OSError as e:
+        raise RuntimeError(
+            f"Could not detect encoding for {csv_path.name}. "
+            f"Tried: {encodings_to_try}. Last error: {e}"
+        ) from e
+    
     last_error = None
     
     for encoding in encodings_to_try:
         try:
-            with open(csv_path, "r", encoding=encoding, newline="") as test_handle:
-                # Read the first chunk to verify the encoding
-                test_handle.read(4096)
+            # Incremental decoding tolerates a multi-byte character cut at the chunk end
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
             return encoding
         except (UnicodeDecodeError, Exception) as e:
             last_error = e
@@ -86,7 +124,7 @@ def read_csv_rows(
     """
     detected_encoding = detect_csv_encoding(csv_path, encoding)
     
-    with open(csv_path, "r", encoding=detected_encoding, newline="") as handle:
+    with open(csv_path, "r", encoding=detected_encoding, newline="", buffering=CSV_READ_BUFFER_SIZE) as handle:
         # Skip rows before the header if specified
         for _ in range(header_skip):
             handle.readline()
@@ -106,6 +144,61 @@ def read_csv_rows(
         yield from reader
 
 
+def read_csv_lists(
+    csv_path: Path,
+    delimiter: str = ";",
+    encoding: str = "utf-8",
+    header_skip: int = 0,
+    detect_encoding: bool = True
+) -> Iterator[list[str]]:
+    """
+    Reads the CSV file as lists of cells instead of row dictionaries.
+    
+    Same encoding detection, header skipping and header normalization as
+    read_csv_rows, without building a dict per row. The first item yielded is
+    the normalized header; every following row is padded with empty cells to
+    the header length, and empty lines are skipped like csv.DictReader does.
+    
+    Args:
+        csv_path: Path to the CSV file
+        delimiter: CSV delimiter
+        encoding: Preferred encoding
+        header_skip: Number of rows to skip before the header row (default: 0)
+        detect_encoding: False if encoding was already detected for this file
+    
+    Yields:
+        Header list first, then one list of cell values per row
+    
+    Raises:
+        ValueError: If the CSV has no header row
+        RuntimeError: If encoding cannot be detected
+    """
+    detected_encoding = detect_csv_encoding(csv_path, encoding) if detect_encoding else encoding
+    
+    with open(csv_path, "r", encoding=detected_encoding, newline="", buffering=CSV_READ_BUFFER_SIZE) as handle:
+        # Skip rows before the header if specified
+        for _ in range(header_skip):
+            handle.readline()
+        
+        reader = csv.reader(handle, delimiter=delimiter)
+        
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"CSV file {csv_path.name} has no header row or is empty")
+        
+        # Normalize header names: trim whitespace
+        header = [fieldname.strip() for fieldname in header]
+        yield header
+        
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            yield row
+
+
 def parse_amount(raw: str, decimal_separator: str = ".") -> Decimal:
     """
     Parses an amount string into Decimal.
@@ -128,8 +221,9 @@ def parse_amount(raw: str, decimal_separator: str = ".") -> Decimal:
     if raw is None:
         raw = ""
     
-    # Remove all whitespace characters, including non-breaking and narrow no-break spaces
-    normalized = re.sub(r"[\s\u00A0\u202F]", "", str(raw))
+    # Remove all whitespace characters, including non-breaking and narrow no-break
+    # spaces (str.split() without arguments splits on every Unicode whitespace)
+    normalized = "".join(str(raw).split())
     
     if decimal_separator == ",":
         # Remove thousands separators and convert comma to dot
@@ -138,6 +232,69 @@ def parse_amount(raw: str, decimal_separator: str = ".") -> Decimal:
     return Decimal(normalized)
 
 
+# Fixed-width date formats used by the bank exports:
+# format -> (length, ((index, separator), ...), ((start, stop) of year, month, day[, hour, minute, second]))
+_FIXED_DATE_LAYOUTS = {
+    "%d.%m.%Y": (10, ((2, "."), (5, ".")), ((6, 10), (3, 5), (0, 2))),
+    "%d/%m/%Y": (10, ((2, "/"), (5, "/")), ((6, 10), (3, 5), (0, 2))),
+    "%Y-%m-%d": (10, ((4, "-"), (7, "-")), ((0, 4), (5, 7), (8, 10))),
+    "%Y-%m-%d %H:%M:%S": (
+        19,
+        ((4, "-"), (7, "-"), (10, " "), (13, ":"), (16, ":")),
+        ((0, 4), (5, 7), (8, 10), (11, 13), (14, 16), (17, 19)),
+    ),
+}
+
+
+def _fixed_date_parser(date_format: str, layout: tuple) -> Callable[[str], datetime]:
+    length, separators, fields = layout
+
+    def parse(raw: str) -> datetime:
+        # Happy path: zero-padded ASCII digits at fixed offsets; everything
+        # else (and invalid dates, for the error message) goes to strptime
+        if len(raw) == length and raw.isascii():
+            for index, separator in separators:
+                if raw[index] != separator:
+                    break
+            else:
+                values = []
+                for start, stop in fields:
+                    part = raw[start:stop]
+                    if not part.isdigit():
+                        break
+                    values.append(int(part))
+                else:
+                    try:
+                        return datetime(*values)
+                    except ValueError:
+                        pass
+        return datetime.strptime(raw, date_format)
+
+    return parse
+
+
+@lru_cache(maxsize=32)
+def get_date_parser(date_format: str) -> Callable[[str], datetime]:
+    """
+    Returns a parser for date strings in the given strptime format.
+    
+    Common fixed-width formats ("%d.%m.%Y", "%d/%m/%Y", "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S") are sliced at fixed offsets instead of going through
+    strptime; inputs that do not fit the fixed layout (e.g. "1.2.2024") fall
+    back to strptime, so results and errors match datetime.strptime.
+    
+    Args:
+        date_format: Python strptime format string (e.g. "%d.%m.%Y")
+    
+    Returns:
+        Callable taking the raw date string and returning a datetime
+    """
+    layout = _FIXED_DATE_LAYOUTS.get(date_format)
+    if layout is None:
+        return lambda raw: datetime.strptime(raw, date_format)
+    return _fixed_date_parser(date_format, layout)
+
+
 def parse_date(raw: str, date_format: str) -> datetime:
     """
     Parses a date string to datetime.
@@ -153,4 +310,4 @@ def parse_date(raw: str, date_format: str) -> datetime:
         >>> parse_date("31.12.2023", "%d.%m.%Y")
         datetime.datetime(2023, 12, 31, 0, 0)
     """
-    return datetime.strptime(raw, date_format)
+    return get_date_parser(date_format)(raw)
@@ -14,7 +14,15 @@ from CSV rows using various mapping strategies.
 """
 
 import re
-from typing import Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a mapping regex once per process; formats reuse the same few patterns."""
+    return re.compile(pattern)
 
 
 def extract_field_value(row: dict[str, Any], mapping: Any) -> str:
@@ -88,7 +96,7 @@ def extract_field_value(row: dict[str, Any], mapping: Any) -> str:
             
             value = row.get(col_name, "") or ""
             try:
-                matches = re.findall(pattern, value)
+                matches = _compile_pattern(pattern).findall(value)
             except re.error:
                 # Invalid regex pattern - skip
                 continue
@@ -114,7 +122,7 @@ def extract_field_value(row: dict[str, Any], mapping: Any) -> str:
         value = row.get(target, "") or ""
         
         try:
-            matches = re.findall(pattern, value)
+            matches = _compile_pattern(pattern).findall(value)
         except re.error:
             return ""
         
@@ -144,3 +152,138 @@ def extract_field_value(row: dict[str, Any], mapping: Any) -> str:
     
     # No recognized mapping strategy
     return ""
+
+
+def _flatten_matches(matches: list, skip_empty_groups: bool) -> list[str]:
+    """Flatten re.findall results (tuples for capture groups) to non-empty strings."""
+    flattened = []
+    for match in matches:
+        if isinstance(match, tuple):
+            match = "".join(g for g in match if g) if skip_empty_groups else "".join(match)
+        if match:
+            flattened.append(match)
+    return flattened
+
+
+def _empty(row) -> str:
+    return ""
+
+
+def compile_field_extractor(mapping: Any, header: list[str]) -> Callable[[list[str]], str]:
+    """Build a row -> value callable equivalent to extract_field_value for list rows.
+    
+    Rows are lists of cells in header order, padded to the header length (see
+    csv_utils.read_csv_lists). Column names are resolved to indexes, the
+    mapping strategy is chosen and regex patterns are compiled once, so
+    per-row extraction is plain index access. A header name occurring twice
+    resolves to its last column, as with csv.DictReader. Shapes whose values
+    are not of the expected types fall back to extract_field_value on a dict
+    row to keep its exact behaviour.
+    
+    Args:
+        mapping: Mapping configuration (string, dict, or None)
+        header: Normalized header row of the file
+    
+    Returns:
+        Callable taking a CSV row list and returning the extracted string
+    """
+    index = {name: position for position, name in enumerate(header)}
+
+    def fallback(row: list[str]) -> str:
+        return extract_field_value(dict(zip(header, row)), mapping)
+
+    def cell(col_name: Any) -> Callable[[list[str]], str]:
+        """Raw value getter of a column; missing columns read as empty."""
+        try:
+            position = index.get(col_name)
+        except TypeError:
+            return None
+        return _empty if position is None else itemgetter(position)
+
+    if mapping is None or not isinstance(mapping, (str, dict)):
+        return _empty
+
+    if isinstance(mapping, str) or "name" in mapping:
+        get = cell(mapping if isinstance(mapping, str) else mapping.get("name"))
+        if get is None:
+            return fallback
+        return lambda row: (get(row) or "").strip()
+
+    if "join" in mapping:
+        separator = mapping.get("separator", " ")
+        join_columns = mapping.get("join", [])
+        if not isinstance(separator, str) or not isinstance(join_columns, list):
+            return fallback
+        getters = [cell(item) for item in join_columns]
+        if None in getters:
+            return fallback
+
+        def extract_join(row: list[str]) -> str:
+            parts = ((get(row) or "").strip() for get in getters)
+            return separator.join(part for part in parts if part)
+
+        return extract_join
+
+    if "sources" in mapping:
+        compiled_sources = []
+        for source_config in mapping.get("sources", []):
+            if not isinstance(source_config, dict):
+                continue
+            col_name = source_config.get("name")
+            pattern = source_config.get("regex")
+            if not col_name or not pattern:
+                continue
+            get = cell(col_name)
+            if get is None or not isinstance(pattern, str):
+                return fallback
+            try:
+                compiled_sources.append((get, _compile_pattern(pattern)))
+            except re.error:
+                # Invalid regex pattern - skip
+                continue
+
+        def extract_sources(row: list[str]) -> str:
+            all_matches = []
+            for get, regex in compiled_sources:
+                all_matches.extend(_flatten_matches(regex.findall(get(row) or ""), True))
+            return " | ".join(all_matches)
+
+        return extract_sources
+
+    if "regex" in mapping:
+        pattern = mapping.get("regex")
+        get = cell(mapping.get("source"))
+        if get is None or not isinstance(pattern, str):
+            return fallback
+        try:
+            regex = _compile_pattern(pattern)
+        except re.error:
+            return _empty
+        return lambda row: " | ".join(_flatten_matches(regex.findall(get(row) or ""), False))
+
+    if "names" in mapping:
+        names = mapping.get("names", [])
+        if not isinstance(names, list):
+            return fallback
+        getters = [cell(name) for name in names]
+        if None in getters:
+            return fallback
+        # Names missing from the header can never match
+        getters = [get for get in getters if get is not _empty]
+        if not getters:
+            return _empty
+        if len(getters) == 1:
+            # Usually only one of the alternative names is in the file
+            get = getters[0]
+            return lambda row: (get(row) or "").strip()
+
+        def extract_names(row: list[str]) -> str:
+            for get in getters:
+                value = (get(row) or "").strip()
+                if value:
+                    return value
+            return ""
+
+        return extract_names
+
+    return _empty
@@ -9,9 +9,10 @@
 import logging
 from typing import List, Optional
 from services.import_steps.base import ImportStep
-from services.csv_utils import read_csv_rows, parse_amount, parse_date
-from services.field_extractor import extract_field_value
+from services.csv_utils import read_csv_lists, parse_amount, get_date_parser
+from services.field_extractor import compile_field_extractor, extract_field_value
 from infrastructure.unit_of_work import UnitOfWork
+from mysql.connector.errors import Error as MySQLError, IntegrityError
 from pathlib import Path
 from fastapi import HTTPException
 from config import get_config_section
@@ -125,6 +126,7 @@ def import_csv_with_optional_account(
     columns = mapping.get("columns", {})
     
     has_account_column = columns.get("account") is not None
+    parse_date_value = get_date_parser(date_format)
     
     inserted = 0
     total = 0
@@ -151,30 +153,70 @@ def import_csv_with_optional_account(
         nonlocal inserted
         if not batch_rows:
             return
-        with UnitOfWork(connection) as uow:
-            tx_repo = TransactionRepository(uow)
-            inserted += tx_repo.insert_ignore_many(batch_rows)
-        batch_rows.clear()
+        batch_inserted = 0
+        try:
+            try:
+                batch_inserted = tx_repo.insert_ignore_many(batch_rows)
+            except IntegrityError as exc:
+                # INSERT IGNORE downgrades duplicates to warnings; should a constraint
+                # still reject the batch, retry its rows one by one and skip the offenders
+                uow.rollback()
+                warnings.append(f"Batch insert failed, retrying row by row: {str(exc)}")
+                for batch_row in batch_rows:
+                    try:
+                        batch_inserted += tx_repo.insert_ignore_many([batch_row])
+                    except IntegrityError as row_exc:
+                        warnings.append(f"Skipped row: {str(row_exc)}")
+            uow.commit()
+            inserted += batch_inserted
+        except MySQLError as exc:
+            # Earlier batches are already committed: skip only this batch and
+            # report it instead of failing the whole (partially imported) file
+            try:
+                uow.rollback()
+            except MySQLError:
+                pass
+            warnings.append(f"Batch of {len(batch_rows)} rows not imported: {str(exc)}")
+        except Exception:
+            uow.rollback()
+            raise
+        finally:
+            batch_rows.clear()
 
     # Read and process CSV using centralized utilities
     try:
-        for row in read_csv_rows(csv_path, delimiter=delimiter, encoding=encoding, header_skip=header_skip):
-            total += 1
-            try:
-                # Determine account ID for this row
-                row_account_id = default_account_id
+        # One unit of work for the whole file, committed per batch
+        with UnitOfWork(connection) as uow:
+            tx_repo = TransactionRepository(uow)
+            account_repo = AccountRepository(uow)
+
+            rows = read_csv_lists(csv_path, delimiter=delimiter, encoding=encoding, header_skip=header_skip)
+            # read_csv_lists yields the normalized header first; the column mappings
+            # are resolved to index-based extractors once per file
+            header = next(rows)
+            extract_account = compile_field_extractor(columns.get("account"), header)
+            extract_date = compile_field_extractor(columns.get("dateValue"), header)
+            extract_amount = compile_field_extractor(columns.get("amount"), header)
+            extract_description = compile_field_extractor(columns.get("description"), header)
+            extract_iban = compile_field_extractor(columns.get("iban"), header)
+            extract_bic = compile_field_extractor(columns.get("bic"), header)
+            extract_recipient = compile_field_extractor(columns.get("recipientApplicant"), header)
+
+            for row in rows:
+                total += 1
+                try:
+                    # Determine account ID for this row
+                    row_account_id = default_account_id
                 
-                if has_account_column:
-                    # Get account name from CSV
-                    account_name_raw = _get_field_value(row, columns.get("account"))
-                    if account_name_raw:
-                        account_name = account_name_raw.strip()
+                    if has_account_column:
+                        # Get account name from CSV
+                        account_name_raw = extract_account(row)
+                        if account_name_raw:
+                            account_name = account_name_raw.strip()
                         
-                        # Look up account by name (reuse same connection)
-                        if account_name not in account_cache:
-                            try:
-                                with UnitOfWork(connection) as uow:
-                                    account_repo = AccountRepository(uow)
+                            # Look up account by name (reuse same connection)
+                            if account_name not in account_cache:
+                                try:
                                     account_id = account_repo.get_id_by_name(account_name)
 
                                     if account_id:
@@ -187,50 +229,50 @@ def import_csv_with_optional_account(
                                         else:
                                             warnings.append(f"Account '{account_name}' not found, skipping row {total}")
                                             continue
-                            except Exception as lookup_error:
-                                warnings.append(f"Error looking up account '{account_name}': {str(lookup_error)}")
-                                continue
+                                except Exception as lookup_error:
+                                    warnings.append(f"Error looking up account '{account_name}': {str(lookup_error)}")
+                                    continue
                         
-                        row_account_id = account_cache.get(account_name)
+                            row_account_id = account_cache.get(account_name)
                 
-                if not row_account_id:
-                    warnings.append(f"No account specified for row {total}, skipping")
-                    continue
+                    if not row_account_id:
+                        warnings.append(f"No account specified for row {total}, skipping")
+                        continue
                 
-                # Extract transaction fields
-                date_value_raw = _get_field_value(row, columns.get("dateValue"))
-                amount_raw = _get_field_value(row, columns.get("amount"))
-                description = _get_field_value(row, columns.get("description"))
-                iban = _get_field_value(row, columns.get("iban"))
-                bic = _get_field_value(row, columns.get("bic"))
-                recipient = _get_field_value(row, columns.get("recipientApplicant"))
+                    # Extract transaction fields
+                    date_value_raw = extract_date(row)
+                    amount_raw = extract_amount(row)
+                    description = extract_description(row)
+                    iban = extract_iban(row)
+                    bic = extract_bic(row)
+                    recipient = extract_recipient(row)
                 
-                # Parse values using centralized utilities
-                date_value = parse_date(date_value_raw, date_format)
-                amount = parse_amount(amount_raw, decimal_sep)
+                    # Parse values using centralized utilities
+                    date_value = parse_date_value(date_value_raw)
+                    amount = parse_amount(amount_raw, decimal_sep)
                 
-                # Batch insert rows for better performance
-                batch_rows.append(
-                    (
-                        iban or None,
-                        bic or None,
-                        description,
-                        amount,
-                        date_value,
-                        recipient or None,
-                        row_account_id,
+                    # Batch insert rows for better performance
+                    batch_rows.append(
+                        (
+                            iban or None,
+                            bic or None,
+                            description,
+                            amount,
+                            date_value,
+                            recipient or None,
+                            row_account_id,
+                        )
                     )
-                )
+                except Exception as exc:
+                    # Extraction/parse errors skip the row; insert errors are handled per batch
+                    warnings.append(f"Row {total}: {str(exc)}")
+                    continue
+
                 if len(batch_rows) >= batch_size:
                     flush_batch()
-            
-            except Exception as exc:
-                error_msg = str(exc).lower()
-                if "duplicate" not in error_msg and "unique" not in error_msg:
-                    warnings.append(f"Row {total}: {str(exc)}")
     
-        # Flush remaining rows
-        flush_batch()
+            # Flush remaining rows
+            flush_batch()
 
     except (ValueError, RuntimeError) as file_error:
         # CSV reading errors (encoding, no header, etc.)
@@ -37,6 +37,8 @@ class TestDatabaseSchema:
             'tbl_share',
             'tbl_shareHistory',
             'tbl_shareTransaction',
+            'tbl_shareAggregates',
+            'tbl_accountMonthFlow',
             'tbl_transaction',
             'tbl_setting',
             'schema_migrations'
@@ -0,0 +1,36 @@
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2026 m2-eng
+# Author: m2-eng
+# License: GNU Affero General Public License v3.0 (AGPL-3.0-only)
+# Purpose: Pytest configuration for unit tests (no database, no API server)
+#
+"""
+Pytest configuration for unit tests.
+
+Unit tests import the application modules from src/ directly and need
+neither the test database nor a running API. The database fixtures that
+tests/conftest.py applies to every test (autouse) are overridden here with
+no-ops, so `pytest tests/unit` runs on a plain checkout.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def init_test_database():
+    """Unit tests do not touch the test database."""
+    yield
+
+
+@pytest.fixture(scope="function", autouse=True)
+def cleanup_test_data():
+    """Unit tests leave no data behind."""
+    yield
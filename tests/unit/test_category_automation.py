@@ -0,0 +1,153 @@
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2026 m2-eng
+# Author: m2-eng
+# License: GNU Affero General Public License v3.0 (AGPL-3.0-only)
+# Purpose: Unit tests for the condition logic evaluation of category automation rules
+#
+"""
+Unit tests for parse_condition_logic / compile_logic.
+
+The expected values pin the semantics of the former eval()-based
+implementation: Python precedence (NOT > AND > OR), German operators,
+unknown IDs evaluated as their integer value and OR-ing all conditions
+whenever the expression cannot be parsed.
+"""
+
+import logging
+
+import pytest
+
+from services.category_automation import compile_logic, parse_condition_logic
+
+pytestmark = pytest.mark.unit
+
+T, F = True, False
+
+
+class TestConditionLogic:
+    """Evaluation of well-formed condition logic expressions."""
+
+    @pytest.mark.parametrize("logic, results, expected", [
+        ("1 OR 2", {1: T, 2: F}, True),
+        ("1 AND 2", {1: T, 2: F}, False),
+        # AND binds tighter than OR
+        ("1 OR 2 AND 3", {1: T, 2: F, 3: F}, True),
+        ("1 AND 2 OR 3", {1: F, 2: T, 3: T}, True),
+        ("1 AND 2 OR 3", {1: F, 2: T, 3: F}, False),
+        # Parentheses override precedence
+        ("(1 OR 2) AND 3", {1: T, 2: F, 3: F}, False),
+        ("(1 OR 2) AND 3", {1: F, 2: T, 3: T}, True),
+        ("((1 OR 2) AND (3 OR 4))", {1: F, 2: T, 3: F, 4: T}, True),
+        # NOT binds tighter than AND
+        ("1 AND NOT 2", {1: T, 2: F}, True),
+        ("1 AND NOT 2", {1: T, 2: T}, False),
+        ("1 OR NOT 2 AND 3", {1: F, 2: F, 3: T}, True),
+        # IDs are whole numbers: 1 must not match inside 10
+        ("1 OR 10", {1: F, 10: T}, True),
+        ("10 AND 1", {1: T, 10: F}, False),
+        # Operators are case-insensitive
+        ("1 and 2", {1: T, 2: T}, True),
+        ("1 or 2", {1: F, 2: F}, False),
+    ])
+    def test_english_operators(self, logic, results, expected):
+        """AND/OR/NOT with Python precedence and parentheses."""
+        assert parse_condition_logic(logic, results) is expected
+
+    @pytest.mark.parametrize("logic, results, expected", [
+        ("1 UND 2", {1: T, 2: F}, False),
+        ("1 ODER 2", {1: F, 2: T}, True),
+        ("(1 ODER 3) UND 2", {1: F, 2: T, 3: T}, True),
+        ("(1 ODER 3) UND 2", {1: T, 2: F, 3: T}, False),
+        ("1 UND NICHT 2", {1: T, 2: F}, True),
+        ("1 und 2 oder 3", {1: F, 2: F, 3: T}, True),
+        # German and English operators may be mixed
+        ("1 UND 2 OR 3", {1: T, 2: T, 3: F}, True),
+    ])
+    def test_german_operators(self, logic, results, expected):
+        """UND/ODER/NICHT are aliases of AND/OR/NOT."""
+        assert parse_condition_logic(logic, results) is expected
+
+    @pytest.mark.parametrize("logic, results, expected", [
+        # Unknown non-zero IDs are truthy, like the bare integer under eval()
+        ("1 AND 5", {1: T}, True),
+        ("5", {1: F}, True),
+        ("1 OR 5", {1: F}, True),
+        # Zero is falsy
+        ("0 OR 1", {1: F}, False),
+        ("1 AND 0", {1: T}, False),
+        ("1 AND NOT 0", {1: T}, True),
+    ])
+    def test_unknown_and_zero_ids(self, logic, results, expected):
+        """IDs without a condition result evaluate to their integer value."""
+        assert parse_condition_logic(logic, results) is expected
+
+    @pytest.mark.parametrize("logic, results, expected", [
+        ("NOT 1", {1: T}, False),
+        ("NICHT 1", {1: F}, True),
+        ("NOT 1 AND 2", {1: F, 2: T}, True),
+        ("(NOT 1) OR 2", {1: T, 2: F}, False),
+    ])
+    def test_leading_not_is_negation(self, logic, results, expected):
+        """
+        A leading NOT/NICHT negates its operand.
+
+        The eval() implementation only translated ' NOT ' between two
+        operands and fell back to OR-ing all conditions here; the compiled
+        evaluator treats it as a regular negation.
+        """
+        assert parse_condition_logic(logic, results) is expected
+
+    def test_result_is_bool(self):
+        """Unknown IDs never leak integers into the result."""
+        assert parse_condition_logic("1 OR 7", {1: F}) is True
+        assert parse_condition_logic("7", {1: F}) is True
+
+    def test_compiled_predicate_is_cached(self):
+        """The same expression compiles once and is reused across calls."""
+        assert compile_logic("(1 OR 2) AND 3") is compile_logic("(1 OR 2) AND 3")
+        predicate = compile_logic("(1 OR 2) AND 3")
+        assert predicate({1: T, 2: F, 3: T}) is True
+        assert predicate({1: F, 2: F, 3: T}) is False
+
+
+class TestConditionLogicFallback:
+    """Inputs that fall back to OR-ing all condition results."""
+
+    @pytest.mark.parametrize("logic", [
+        "1 AND",
+        "AND 1",
+        "(1 OR 2",
+        "1 OR 2)",
+        "1 2",
+        "1 XOR 2",
+        "1 && 2",
+        "True",
+        "__import__('os')",
+        "1; 2",
+    ])
+    @pytest.mark.parametrize("results, expected", [
+        ({1: T, 2: F}, True),
+        ({1: F, 2: F}, False),
+    ])
+    def test_malformed_falls_back_to_or_all(self, logic, results, expected, caplog):
+        """Malformed expressions log a warning and OR all conditions."""
+        with caplog.at_level(logging.WARNING, logger="uvicorn.error"):
+            assert parse_condition_logic(logic, results) is expected
+        assert "Failed to parse condition logic" in caplog.text
+
+    @pytest.mark.parametrize("logic", ["1 AND", "(1 OR 2", "1 XOR 2"])
+    def test_compile_logic_rejects_malformed(self, logic):
+        """compile_logic raises ValueError; parse_condition_logic does the fallback."""
+        with pytest.raises(ValueError):
+            compile_logic(logic)
+
+    @pytest.mark.parametrize("logic", ["", None])
+    def test_empty_logic_ors_all(self, logic):
+        """Without an expression all conditions are OR-ed."""
+        assert parse_condition_logic(logic, {1: F, 2: T}) is True
+        assert parse_condition_logic(logic, {1: F, 2: F}) is False
+
+    def test_empty_results(self):
+        """Without condition results nothing matches."""
+        assert parse_condition_logic("1 AND 2", {}) is False
@@ -0,0 +1,244 @@
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2026 m2-eng
+# Author: m2-eng
+# License: GNU Affero General Public License v3.0 (AGPL-3.0-only)
+# Purpose: Unit tests for CSV import parsing (date parsers, list reader, compiled field extractors)
+#
+"""
+Unit tests for the CSV import parsing helpers.
+
+The import path reads rows with read_csv_lists and extracts fields with
+compile_field_extractor / get_date_parser. These tests pin them to the
+reference behaviour of csv.DictReader (read_csv_rows), extract_field_value
+and datetime.strptime.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from services.csv_utils import get_date_parser, parse_date, read_csv_lists, read_csv_rows
+from services.field_extractor import compile_field_extractor, extract_field_value
+
+pytestmark = pytest.mark.unit
+
+
+def _strptime_outcome(raw, date_format):
+    """Result of datetime.strptime, or the (type, message) of its error."""
+    try:
+        return datetime.strptime(raw, date_format)
+    except ValueError as exc:
+        return (type(exc), str(exc))
+
+
+def _parser_outcome(raw, date_format):
+    try:
+        return get_date_parser(date_format)(raw)
+    except ValueError as exc:
+        return (type(exc), str(exc))
+
+
+def _extract_outcome(extract, row, mapping):
+    """Extracted value, or the (type, message) of the error raised for the mapping."""
+    try:
+        return extract(row, mapping)
+    except Exception as exc:
+        return (type(exc), str(exc))
+
+
+class TestDateParser:
+    """get_date_parser must behave exactly like datetime.strptime."""
+
+    @pytest.mark.parametrize("raw, date_format, expected", [
+        ("01.02.2024", "%d.%m.%Y", datetime(2024, 2, 1)),
+        ("31.12.2023", "%d.%m.%Y", datetime(2023, 12, 31)),
+        ("29.02.2024", "%d.%m.%Y", datetime(2024, 2, 29)),
+        ("05/06/2024", "%d/%m/%Y", datetime(2024, 6, 5)),
+        ("2024-03-09", "%Y-%m-%d", datetime(2024, 3, 9)),
+        ("2024-03-09 07:08:09", "%Y-%m-%d %H:%M:%S", datetime(2024, 3, 9, 7, 8, 9)),
+    ])
+    def test_padded_dates(self, raw, date_format, expected):
+        """Zero-padded dates are parsed on the fixed-offset fast path."""
+        assert get_date_parser(date_format)(raw) == expected
+
+    @pytest.mark.parametrize("raw, date_format", [
+        ("1.2.2024", "%d.%m.%Y"),
+        ("1.02.2024", "%d.%m.%Y"),
+        ("01.2.2024", "%d.%m.%Y"),
+        (" 1.02.2024", "%d.%m.%Y"),
+        ("5/6/2024", "%d/%m/%Y"),
+        ("2024-3-9", "%Y-%m-%d"),
+        ("2024-03-09 7:08:09", "%Y-%m-%d %H:%M:%S"),
+    ])
+    def test_unpadded_dates_fall_back_to_strptime(self, raw, date_format):
+        """Dates that do not fit the fixed layout are parsed by strptime."""
+        assert get_date_parser(date_format)(raw) == datetime.strptime(raw, date_format)
+
+    @pytest.mark.parametrize("raw, date_format", [
+        ("31.02.2024", "%d.%m.%Y"),
+        ("29.02.2023", "%d.%m.%Y"),
+        ("00.01.2024", "%d.%m.%Y"),
+        ("01.13.2024", "%d.%m.%Y"),
+        ("01-02-2024", "%d.%m.%Y"),
+        ("01.02.24", "%d.%m.%Y"),
+        ("aa.bb.cccc", "%d.%m.%Y"),
+        ("01.02.2024 ", "%d.%m.%Y"),
+        ("", "%d.%m.%Y"),
+        ("2024-02-30", "%Y-%m-%d"),
+        ("2024-02-01", "%d.%m.%Y"),
+        ("2024-03-09 24:00:00", "%Y-%m-%d %H:%M:%S"),
+        ("2024-03-09", "%Y-%m-%d %H:%M:%S"),
+    ])
+    def test_invalid_dates_raise_strptime_errors(self, raw, date_format):
+        """Invalid dates raise the same ValueError (type and message) as strptime."""
+        expected = _strptime_outcome(raw, date_format)
+        assert isinstance(expected, tuple), "test input must be invalid for strptime"
+        assert _parser_outcome(raw, date_format) == expected
+
+    @pytest.mark.parametrize("raw", ["01.02.2024", "1.2.2024", "01.02.24", "31.02.2024"])
+    def test_other_formats_use_strptime(self, raw):
+        """Formats without a fixed layout go straight to strptime."""
+        assert _parser_outcome(raw, "%d.%m.%y") == _strptime_outcome(raw, "%d.%m.%y")
+
+    def test_parser_is_cached_per_format(self):
+        assert get_date_parser("%d.%m.%Y") is get_date_parser("%d.%m.%Y")
+
+    def test_parse_date_delegates(self):
+        assert parse_date("01.02.2024", "%d.%m.%Y") == datetime(2024, 2, 1)
+        with pytest.raises(ValueError):
+            parse_date("31.02.2024", "%d.%m.%Y")
+
+
+@pytest.fixture
+def bank_csv(tmp_path):
+    """A CSV with a preamble, padded headers, a duplicate header, short and empty rows."""
+    content = (
+        "Kontoauszug;Export\n"
+        " Buchungstag ;Betrag; Verwendungszweck ;Empfaenger;Info;Info;IBAN\n"
+        "01.02.2024;-12,50;REWE SAGT DANKE 4711;REWE Markt;erste;zweite;DE02120300000000202051\n"
+        "02.02.2024;1.234,56;Gehalt Januar;  Arbeitgeber GmbH ;;letzte;\n"
+        "\n"
+        "03.02.2024;-5,00;Kurz\n"
+        "04.02.2024;-7,00;EREF: ABC-123 MREF: M-9 Miete;Vermieter;x;y;DE89370400440532013000;extra\n"
+        "05.02.2024\n"
+    )
+    path = tmp_path / "konto.csv"
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _read_both(path):
+    """Rows of the file as (header, list rows) and as DictReader dicts."""
+    lists = read_csv_lists(path, delimiter=";", header_skip=1)
+    header = next(lists)
+    return header, list(lists), list(read_csv_rows(path, delimiter=";", header_skip=1))
+
+
+class TestReadCsvLists:
+    """read_csv_lists yields the same rows as read_csv_rows, as lists."""
+
+    def test_header_is_normalized(self, bank_csv):
+        header, _, _ = _read_both(bank_csv)
+        assert header == ["Buchungstag", "Betrag", "Verwendungszweck", "Empfaenger", "Info", "Info", "IBAN"]
+
+    def test_empty_lines_are_skipped(self, bank_csv):
+        _, list_rows, dict_rows = _read_both(bank_csv)
+        assert len(list_rows) == len(dict_rows) == 5
+
+    def test_short_rows_are_padded(self, bank_csv):
+        header, list_rows, _ = _read_both(bank_csv)
+        assert list_rows[2] == ["03.02.2024", "-5,00", "Kurz", "", "", "", ""]
+        assert list_rows[4] == ["05.02.2024", "", "", "", "", "", ""]
+        assert all(len(row) >= len(header) for row in list_rows)
+
+    def test_long_rows_keep_extra_cells(self, bank_csv):
+        header, list_rows, _ = _read_both(bank_csv)
+        assert list_rows[3][len(header):] == ["extra"]
+
+    def test_cells_match_dict_reader(self, bank_csv):
+        """Every named cell matches DictReader; duplicate headers resolve to the last column."""
+        header, list_rows, dict_rows = _read_both(bank_csv)
+        for row, dict_row in zip(list_rows, dict_rows):
+            by_name = dict(zip(header, row))
+            for name in header:
+                assert by_name[name] == (dict_row[name] or "")
+        assert dict(zip(header, list_rows[0]))["Info"] == "zweite"
+
+    def test_without_encoding_detection(self, bank_csv):
+        lists = read_csv_lists(bank_csv, delimiter=";", header_skip=1, detect_encoding=False)
+        assert next(lists)[0] == "Buchungstag"
+
+    def test_empty_file_has_no_header(self, tmp_path):
+        path = tmp_path / "leer.csv"
+        path.write_text("", encoding="utf-8")
+        with pytest.raises(ValueError, match="no header row"):
+            next(read_csv_lists(path))
+
+
+MAPPINGS = {
+    "legacy_string": "Verwendungszweck",
+    "legacy_string_missing": "Fehlt",
+    "name": {"name": "Empfaenger"},
+    "name_missing": {"name": "Fehlt"},
+    "name_duplicate": {"name": "Info"},
+    "join": {"join": ["Buchungstag", "Empfaenger", "Info"], "separator": " | "},
+    "join_default_separator": {"join": ["Empfaenger", "Fehlt", "IBAN"]},
+    "join_empty": {"join": []},
+    "sources": {"sources": [
+        {"name": "Verwendungszweck", "regex": r"EREF: (\S+)"},
+        {"name": "Verwendungszweck", "regex": r"MREF: (\S+)|(DANKE) (\d+)"},
+        {"name": "Fehlt", "regex": r".+"},
+        {"name": "IBAN", "regex": "["},
+        {"name": "IBAN"},
+        "kein dict",
+    ]},
+    "sources_empty": {"sources": []},
+    "regex": {"regex": r"(\d+)", "source": "Verwendungszweck"},
+    "regex_groups": {"regex": r"([A-Z]+)-(\d+)?", "source": "Verwendungszweck"},
+    "regex_invalid": {"regex": "(", "source": "Verwendungszweck"},
+    "regex_missing_source": {"regex": r".+", "source": "Fehlt"},
+    "names_first_wins": {"names": ["Fehlt", "Empfaenger", "IBAN"]},
+    "names_single": {"names": ["Fehlt", "IBAN"]},
+    "names_none_present": {"names": ["Fehlt", "Auch nicht"]},
+    "names_duplicate": {"names": ["Info", "IBAN"]},
+    "unknown_strategy": {"foo": "bar"},
+    "empty_dict": {},
+    "none": None,
+    "not_a_mapping": ["Verwendungszweck"],
+    # Shapes with unexpected value types take the extract_field_value fallback,
+    # including the errors it raises for them
+    "name_unhashable": {"name": ["Empfaenger"]},
+    "join_string": {"join": "IBAN"},
+    "names_string": {"names": "IBAN"},
+    "regex_not_string": {"regex": 5, "source": "Verwendungszweck"},
+}
+
+
+class TestCompiledFieldExtractor:
+    """compile_field_extractor on list rows matches extract_field_value on DictReader rows."""
+
+    @pytest.mark.parametrize("mapping_name", sorted(MAPPINGS))
+    def test_matches_extract_field_value(self, bank_csv, mapping_name):
+        mapping = MAPPINGS[mapping_name]
+        header, list_rows, dict_rows = _read_both(bank_csv)
+        extract = compile_field_extractor(mapping, header)
+        for row, dict_row in zip(list_rows, dict_rows):
+            assert _extract_outcome(lambda r, m: extract(r), row, mapping) == _extract_outcome(
+                extract_field_value, dict_row, mapping
+            )
+
+    @pytest.mark.parametrize("mapping, expected", [
+        ({"name": "Empfaenger"}, ["REWE Markt", "Arbeitgeber GmbH", "", "Vermieter", ""]),
+        ({"name": "Info"}, ["zweite", "letzte", "", "y", ""]),
+        ({"join": ["Buchungstag", "Info"], "separator": " | "},
+         ["01.02.2024 | zweite", "02.02.2024 | letzte", "03.02.2024", "04.02.2024 | y", "05.02.2024"]),
+        ({"sources": [{"name": "Verwendungszweck", "regex": r"EREF: (\S+)"}]}, ["", "", "", "ABC-123", ""]),
+        ({"names": ["Fehlt", "IBAN", "Empfaenger"]},
+         ["DE02120300000000202051", "Arbeitgeber GmbH", "", "DE89370400440532013000", ""]),
+    ])
+    def test_expected_values(self, bank_csv, mapping, expected):
+        """Spot checks of the extracted values themselves."""
+        header, list_rows, _ = _read_both(bank_csv)
+        extract = compile_field_extractor(mapping, header)
+        assert [extract(row) for row in list_rows] == expected
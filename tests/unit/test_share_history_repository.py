@@ -0,0 +1,63 @@
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+# Copyright (c) 2026 m2-eng
+# Author: m2-eng
+# License: GNU Affero General Public License v3.0 (AGPL-3.0-only)
+# Purpose: Unit tests for ShareHistoryRepository queries
+#
+"""
+Unit tests for ShareHistoryRepository.
+
+The statements are checked after mysql-connector's own parameter
+substitution, i.e. as the server receives them: the connector only
+replaces %s markers and does not unescape '%%'.
+"""
+
+from datetime import date
+
+import pytest
+from mysql.connector.cursor import RE_PY_PARAM
+
+from repositories.share_history_repository import ShareHistoryRepository
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingCursor:
+    """Minimal cursor that records executed statements and returns fixed rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, query, params=()):
+        values = iter(params)
+        # Same substitution as mysql-connector's MySQLCursor for sequence params
+        statement = RE_PY_PARAM.sub(lambda match: repr(next(values)).encode(), query.encode())
+        self.statements.append(statement.decode())
+
+    def fetchall(self):
+        return self.rows
+
+
+class TestGetExistingDatesForShare:
+    """Dates of existing history entries as used by the share history import."""
+
+    def test_statement_sent_to_server(self):
+        cursor = RecordingCursor([])
+        ShareHistoryRepository(cursor).get_existing_dates_for_share(7)
+        assert cursor.statements == ["SELECT DISTINCT DATE(date) FROM tbl_shareHistory WHERE share = 7"]
+        assert "%%" not in cursor.statements[0]
+
+    def test_dates_are_iso_strings(self):
+        cursor = RecordingCursor([(date(2024, 1, 31),), (date(2024, 2, 29),)])
+        dates = ShareHistoryRepository(cursor).get_existing_dates_for_share(7)
+        assert dates == {"2024-01-31", "2024-02-29"}
+
+    def test_string_values(self):
+        cursor = RecordingCursor([("2024-03-31T00:00:00",), ("2024-04-30",)])
+        dates = ShareHistoryRepository(cursor).get_existing_dates_for_share(7)
+        assert dates == {"2024-03-31", "2024-04-30"}
+
+    def test_no_history(self):
+        assert ShareHistoryRepository(RecordingCursor([])).get_existing_dates_for_share(7) == set()